@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the simulator hot paths
+
+Times calculate_fusion_rate, update_simulation (uniform, ensemble and
+spatial), detect_resonance_peaks, run_parameter_sweep and
+CorrectedFusionSimulator.run_mathematical_consistency_check at several
+problem sizes, reporting throughput and peak traced memory.
+
+Each case is timed `--repeats` times and the fastest run is kept (the least
+disturbed by other load); peak memory comes from one extra run under
+tracemalloc, so tracing never skews the timings.
+
+The simulators' Bosch-Hale parametrization is zero at every energy, so in the
+fusion_rate_quad/table cases quad converges on a zero integrand at once and
+the table lookup comes out slower. The fusion_rate_gamow_* cases time both
+paths on the bare Gamow cross-section, which is nonzero everywhere.
+
+Usage:
+    python benchmarks/bench_simulators.py                        # run and print
+    python benchmarks/bench_simulators.py --save baseline.json   # store a baseline
+    python benchmarks/bench_simulators.py --compare baseline.json --threshold 0.15
+    python benchmarks/bench_simulators.py --quick --only fusion_rate,tick
+
+With --compare the exit status is 1 if any case lost more than `threshold`
+of its baseline throughput.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fusion_physics_simulation import (  # noqa: E402
+    EnsembleFusionSimulator, FusionPhysicsSimulator, run_parameter_sweep
+)
+from corrected_fusion_simulation import CorrectedFusionSimulator  # noqa: E402
+from fusion_core import TorusGeometry  # noqa: E402
+
+@dataclass
+class BenchmarkCase:
+    """One hot path at one problem size
+
+    `setup(size)` does the untimed preparation and returns a zero-argument
+    callable; one call of it performs `size` × `work_per_size` units of work
+    (ticks, evaluations, member-ticks...), which is what the throughput is
+    reported in.
+    """
+    name: str
+    unit: str
+    sizes: List[int]
+    quick_sizes: List[int]
+    setup: Callable[[int], Callable[[], object]]
+    work_per_size: int = 1
+
+# Shared reactivity table, built once on first use
+_table = None
+
+def _reactivity_table():
+    global _table
+    if _table is None:
+        _table = FusionPhysicsSimulator(verbose=False).enable_reactivity_table()
+    return _table
+
+def _gamow_cross_section(energy_keV, constants, psi_amplitude, phi_amplitude, coherence_factor):
+    """(classical, enhanced) σ in m² with the bare Gamow form A1 / (E exp(A1/√E))"""
+    energy_keV = np.asarray(energy_keV, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        safe_energy = np.where(energy_keV > 0, energy_keV, 1.0)
+        classical = np.where(energy_keV > 0, 45.95 / (safe_energy * np.exp(45.95 / np.sqrt(safe_energy))), 0.0) * 1e-27
+    energy_MeV = energy_keV / 1000
+    enhanced = classical * coherence_factor * (
+        (1 + psi_amplitude * np.exp(-((energy_MeV - constants.PSI_0)**2) / (2 * 0.1**2))) *
+        (1 + phi_amplitude * np.exp(-((energy_MeV - constants.PHI)**2) / (2 * 0.2**2)))
+    )
+    return np.broadcast_to(classical, enhanced.shape), enhanced
+
+class _GamowFusionSimulator(FusionPhysicsSimulator):
+    """Simulator on the nonzero bare Gamow cross-section, so <σv> quadrature does real work"""
+
+    def calculate_dt_cross_section(self, energy_keV, enhanced=False, harmonic=None):
+        harmonic = harmonic or self.harmonic_state
+        classical, sigma = _gamow_cross_section(energy_keV, self.constants, harmonic.psi_amplitude,
+                                                harmonic.phi_amplitude, harmonic.coherence_factor)
+        return float(sigma if enhanced else classical)
+
+    def calculate_dt_cross_section_batch(self, energy_keV, harmonic=None):
+        return _gamow_cross_section(energy_keV, self.constants, *self._harmonic_arrays(harmonic))
+
+# Reactivity table of _GamowFusionSimulator, built once on first use
+_gamow_table = None
+
+def _gamow_reactivity_table():
+    global _gamow_table
+    if _gamow_table is None:
+        _gamow_table = _GamowFusionSimulator(verbose=False).enable_reactivity_table()
+    return _gamow_table
+
+def _setup_fusion_rate(use_table: bool, simulator=FusionPhysicsSimulator, table=_reactivity_table):
+    def setup(size: int):
+        sim = simulator(reactivity_table=table() if use_table else None, verbose=False)
+        temperatures = np.linspace(1, 50, size)
+        states = [sim.calculate_plasma_parameters(T, 10.0, 0.5) for T in temperatures]
+
+        def run():
+            for plasma in states:
+                sim.calculate_fusion_rate(plasma, sim.harmonic_state)
+        return run
+    return setup
+
+def _setup_tick(size: int):
+    table = _reactivity_table()
+
+    def run():
+        sim = FusionPhysicsSimulator(reactivity_table=table, verbose=False)
+        for _ in range(size):
+            sim.update_simulation(10.0, 10.0, 0.5)
+    return run
+
+def _setup_ensemble_tick(size: int):
+    table = _reactivity_table()
+    members = np.linspace(1, 20, size)
+
+    def run():
+        sim = EnsembleFusionSimulator(members, np.full(size, 10.0), np.full(size, 0.5),
+                                      reactivity_table=table, verbose=False)
+        for _ in range(50):
+            sim.update_simulation()
+    return run
+
+def _setup_spatial_tick(size: int):
+    # `size` cells on a square (ρ, θ) grid, 10 ticks per run
+    cells = int(round(np.sqrt(size)))
+    sim = FusionPhysicsSimulator(reactivity_table=_reactivity_table(), verbose=False)
+    sim.enable_spatial_model(TorusGeometry(radial_cells=cells, poloidal_cells=cells))
+
+    def run():
+        for _ in range(10):
+            sim.update_simulation(10.0, 10.0, 0.5)
+    return run
+
+def _setup_resonance_peaks(size: int):
+    sim = FusionPhysicsSimulator(verbose=False)
+    energies = np.linspace(0.1, 10, size)
+    return lambda: sim.detect_resonance_peaks(energies)
+
+def _setup_parameter_sweep(size: int):
+    # `size` points: size/4 temperatures x 2 fields x 2 amplitudes, in-process so
+    # timings are stable, sharing the prebuilt table so only the sweep is timed
+    temperatures = np.linspace(1, 20, size // 4)
+    table = _reactivity_table()
+    return lambda: run_parameter_sweep(temperatures, [8.0, 12.0], [0.3, 0.7], steps=10, workers=1,
+                                       save=False, reactivity_table=table)
+
+def _setup_consistency_check(size: int):
+    sim = CorrectedFusionSimulator()
+    energies = np.linspace(0.01, 10, size)
+    return lambda: sim.run_mathematical_consistency_check(energies)
+
+CASES = [
+    BenchmarkCase('fusion_rate_quad', 'evaluations', [10, 100], [10], _setup_fusion_rate(False)),
+    BenchmarkCase('fusion_rate_table', 'evaluations', [100, 1000, 10000], [100], _setup_fusion_rate(True)),
+    BenchmarkCase('fusion_rate_gamow_quad', 'evaluations', [10, 100], [10],
+                  _setup_fusion_rate(False, _GamowFusionSimulator, _gamow_reactivity_table)),
+    BenchmarkCase('fusion_rate_gamow_table', 'evaluations', [100, 1000, 10000], [100],
+                  _setup_fusion_rate(True, _GamowFusionSimulator, _gamow_reactivity_table)),
+    BenchmarkCase('tick', 'ticks', [100, 1000, 10000], [100], _setup_tick),
+    BenchmarkCase('ensemble_tick', 'member-ticks', [10, 100, 1000], [10], _setup_ensemble_tick, work_per_size=50),
+    BenchmarkCase('spatial_tick', 'cell-ticks', [10**4, 10**5], [10**4], _setup_spatial_tick, work_per_size=10),
+    BenchmarkCase('resonance_peaks', 'energies', [100, 10000, 1000000], [100, 10000], _setup_resonance_peaks),
+    BenchmarkCase('parameter_sweep', 'points', [2 * 2 * 2, 8 * 2 * 2], [2 * 2 * 2], _setup_parameter_sweep),
+    BenchmarkCase('consistency_check', 'energies', [500, 100000, 1000000], [500, 100000], _setup_consistency_check),
+]
+
+def time_case(case: BenchmarkCase, size: int, repeats: int) -> Dict:
+    """Best-of-`repeats` wall time, throughput and tracemalloc peak for one case"""
+    run = case.setup(size)
+    run()  # warm-up: lazy imports, caches, allocator
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        'case': case.name,
+        'size': size,
+        'unit': case.unit,
+        'seconds': best,
+        'median_seconds': float(np.median(timings)),
+        'throughput': size * case.work_per_size / best,
+        'peak_memory_bytes': peak
+    }
+
+def run_benchmarks(only: Optional[List[str]] = None, quick: bool = False, repeats: int = 5) -> Dict:
+    results = []
+    for case in CASES:
+        if only and case.name not in only:
+            continue
+        for size in (case.quick_sizes if quick else case.sizes):
+            row = time_case(case, size, repeats)
+            results.append(row)
+            print(f"{case.name:24s} {size * case.work_per_size:>8d} {case.unit:12s} "
+                  f"{row['seconds'] * 1e3:10.2f} ms "
+                  f"{row['throughput']:14,.0f} {case.unit}/s {row['peak_memory_bytes'] / 2**20:8.2f} MiB")
+
+    return {
+        'metadata': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+            'repeats': repeats,
+            'quick': quick
+        },
+        'results': results
+    }
+
+def compare_to_baseline(current: Dict, baseline: Dict, threshold: float) -> List[Dict]:
+    """Cases whose throughput dropped by more than `threshold` (fraction) vs the baseline"""
+    reference = {(row['case'], row['size']): row for row in baseline['results']}
+    regressions = []
+
+    print(f"\nComparison against baseline from {baseline['metadata']['timestamp']} "
+          f"(regression threshold {threshold:.0%}):")
+    for row in current['results']:
+        base = reference.get((row['case'], row['size']))
+        if base is None or base['unit'] != row['unit']:
+            continue  # new case, or throughput measured in different units
+        ratio = row['throughput'] / base['throughput']
+        memory_ratio = row['peak_memory_bytes'] / max(base['peak_memory_bytes'], 1)
+        regressed = ratio < 1 - threshold
+        print(f"{row['case']:24s} {row['size']:>8d} throughput x{ratio:5.2f}  memory x{memory_ratio:5.2f}"
+              f"{'  REGRESSION' if regressed else ''}")
+        if regressed:
+            regressions.append({'case': row['case'], 'size': row['size'],
+                                'throughput_ratio': ratio, 'memory_ratio': memory_ratio})
+
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the simulator hot paths')
+    parser.add_argument('--only', help='comma-separated case names: ' + ', '.join(c.name for c in CASES))
+    parser.add_argument('--quick', action='store_true', help='smallest problem sizes only')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--save', metavar='FILE', help='write results as a JSON baseline')
+    parser.add_argument('--compare', metavar='FILE', help='compare against a saved baseline')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed fractional throughput loss before flagging (default 0.2)')
+    args = parser.parse_args()
+
+    # Keep the simulators' INFO logging out of the measurements
+    logging.basicConfig(level=logging.WARNING, handlers=[logging.NullHandler()])
+
+    only = args.only.split(',') if args.only else None
+    results = run_benchmarks(only, args.quick, args.repeats)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
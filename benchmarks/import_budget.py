@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for the simulator modules
+
+Each module is imported in a fresh interpreter several times, after NumPy
+has already been imported there, and the fastest of those times is compared
+with the budget in import_budget.json. Timing only what a module adds on
+top of NumPy, in the same process, keeps the numbers comparable across
+machines and insensitive to background load. The check also fails if
+importing a module pulls in any of its forbidden heavy dependencies (SciPy,
+pandas, matplotlib).
+
+Usage: python benchmarks/import_budget.py [--repeats N] [--json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'import_budget.json')
+
+_PROBE = '''
+import sys, time, json
+start = time.perf_counter()
+import numpy
+numpy_ms = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+import {module}
+module_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"numpy_ms": numpy_ms, "ms": module_ms,
+                  "loaded": sorted(m.split('.')[0] for m in sys.modules)}}))
+'''
+
+def measure_import(module: str, repeats: int) -> dict:
+    """Fastest import time in ms on top of NumPy, over fresh interpreters, plus modules loaded"""
+    times = []
+    numpy_times = []
+    loaded = set()
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(module=module)],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        sample = json.loads(output.strip().splitlines()[-1])
+        times.append(sample['ms'])
+        numpy_times.append(sample['numpy_ms'])
+        loaded.update(sample['loaded'])
+    return {'ms': min(times), 'numpy_ms': min(numpy_times), 'loaded': loaded}
+
+def check_budgets(repeats: int = 5) -> dict:
+    with open(BUDGET_FILE) as f:
+        config = json.load(f)
+
+    results = {'numpy_baseline_ms': float('inf'), 'modules': {}, 'passed': True}
+
+    for module, budget in config['modules'].items():
+        measured = measure_import(module, repeats)
+        overhead = measured['ms']
+        results['numpy_baseline_ms'] = min(results['numpy_baseline_ms'], measured['numpy_ms'])
+        forbidden = sorted(set(budget.get('forbidden', config['forbidden'])) & measured['loaded'])
+        passed = overhead <= budget['max_ms_over_numpy'] and not forbidden
+        results['modules'][module] = {
+            'import_ms': measured['numpy_ms'] + overhead,
+            'overhead_ms': overhead,
+            'budget_ms': budget['max_ms_over_numpy'],
+            'forbidden_loaded': forbidden,
+            'passed': passed
+        }
+        results['passed'] &= passed
+
+    return results
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+
+    results = check_budgets(args.repeats)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"numpy baseline: {results['numpy_baseline_ms']:.1f} ms")
+        for module, row in results['modules'].items():
+            status = 'ok' if row['passed'] else 'OVER BUDGET'
+            extra = f", loads {', '.join(row['forbidden_loaded'])}" if row['forbidden_loaded'] else ''
+            print(f"{module:32s} {row['import_ms']:7.1f} ms (+{row['overhead_ms']:6.1f} / "
+                  f"{row['budget_ms']:.0f} ms budget) {status}{extra}")
+
+    return 0 if results['passed'] else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
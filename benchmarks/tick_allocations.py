@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Per-tick allocation measurement for FusionPhysicsSimulator.update_simulation
+
+Runs the real-time scenario's ticks (reactivity table attached, ring-buffer
+telemetry) in the default and the low-allocation mode and reports, from
+fusion_profiling.measure_allocations, the peak memory each tick has live,
+what stays allocated afterwards, and how many garbage collections ran.
+
+Usage: python benchmarks/tick_allocations.py [--ticks 2000] [--json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fusion_physics_simulation import (  # noqa: E402
+    FusionPhysicsSimulator, realtime_scenario, set_realtime_operating_point
+)
+from fusion_profiling import measure_allocations  # noqa: E402
+
+def measure_mode(table, low_allocation: bool, ticks: int) -> dict:
+    sim = FusionPhysicsSimulator(reactivity_table=table, verbose=False, telemetry_capacity=1024,
+                                 low_allocation=low_allocation)
+    set_realtime_operating_point(sim)
+    parameters = realtime_scenario(sim)
+    step = 0
+
+    def tick():
+        nonlocal step
+        sim.update_simulation(**parameters(step))
+        step += 1
+
+    return measure_allocations(tick, ticks=ticks)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ticks', type=int, default=2000)
+    parser.add_argument('--json', action='store_true', help='print the raw measurements as JSON')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    table = FusionPhysicsSimulator(verbose=False).enable_reactivity_table()
+    results = {mode: measure_mode(table, mode == 'low_allocation', args.ticks)
+               for mode in ('default', 'low_allocation')}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'mode':<16}{'transient B/tick':>18}{'max B/tick':>12}{'retained B/tick':>17}"
+          f"{'retained blocks/tick':>22}{'gen0 GCs':>10}")
+    for mode, result in results.items():
+        transient = result['transient_bytes']
+        print(f"{mode:<16}{transient['mean']:>18.0f}{transient['max']:>12.0f}"
+              f"{result['retained_bytes_per_tick']:>17.1f}{result['retained_blocks_per_tick']:>22.2f}"
+              f"{result['gc_collections']['generation_0']:>10}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
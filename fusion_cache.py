@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Harmonic Fusion Result Cache
+Content-addressed cache for validation and analysis reports
+
+Results are stored under a SHA-256 of everything they depend on (physics
+constants, energy grid, alpha set, ...), in two tiers: an in-memory LRU of
+JSON-encoded results and an optional directory of JSON files, bounded in total
+size and evicted least-recently-used first. A key never goes stale, since
+changing any input changes the key; invalidate() and clear() drop entries
+explicitly, e.g. after the report code itself changes.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from fusion_core import json_default
+
+# Bumped whenever a cached report's layout changes, so old entries miss
+CACHE_VERSION = 3
+
+# Directory used by the command-line pipelines for the on-disk tier
+DEFAULT_CACHE_DIR = '.fusion_cache'
+
+_MISSING = object()
+
+def _feed(digest, value):
+    """Hash `value` unambiguously: type tags, dataclass fields, array dtype/shape/bytes"""
+    if is_dataclass(value) and not isinstance(value, type):
+        digest.update(f'dataclass:{type(value).__name__}:'.encode())
+        _feed(digest, asdict(value))
+    elif isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        digest.update(f'ndarray:{array.dtype.str}:{array.shape}:'.encode())
+        digest.update(array.tobytes())
+    elif isinstance(value, dict):
+        digest.update(f'dict:{len(value)}:'.encode())
+        for key in sorted(value, key=str):
+            _feed(digest, str(key))
+            _feed(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f'seq:{len(value)}:'.encode())
+        for item in value:
+            _feed(digest, item)
+    elif isinstance(value, (bool, int, float, str, np.generic)) or value is None:
+        digest.update(f'{type(value).__name__}:{value!r};'.encode())
+    else:
+        raise TypeError(f"Cannot hash cache key part of type {type(value).__name__}")
+
+def cache_key(*parts) -> str:
+    """Hex SHA-256 over `parts` (dataclasses, arrays, containers and scalars)"""
+    digest = hashlib.sha256(f'v{CACHE_VERSION}:'.encode())
+    for part in parts:
+        _feed(digest, part)
+    return digest.hexdigest()
+
+class ResultCache:
+    """Two-tier LRU cache of JSON-serializable results
+
+    `max_entries` bounds the in-memory tier. With a `directory`, results are
+    also written there as <key>.json, and the directory is kept under
+    `max_disk_bytes` by deleting the least recently used files (file mtimes
+    are refreshed on every disk hit). Values always come back as decoded JSON
+    (NumPy scalars and arrays become floats and lists), whichever tier served
+    them, and callers get their own copy.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_entries: int = 32,
+                 max_disk_bytes: int = 64 * 2**20):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: 'OrderedDict[str, str]' = OrderedDict()
+        self.hits = {'memory': 0, 'disk': 0}
+        self.misses = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def _remember(self, key: str, encoded: str):
+        self._memory[key] = encoded
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str, default=None) -> Any:
+        encoded = self._memory.get(key)
+        if encoded is not None:
+            self._memory.move_to_end(key)
+            self.hits['memory'] += 1
+            return json.loads(encoded)
+
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                with open(path) as f:
+                    encoded = f.read()
+                value = json.loads(encoded)
+            except (OSError, ValueError):
+                pass
+            else:
+                os.utime(path)  # mark as recently used for eviction
+                self._remember(key, encoded)
+                self.hits['disk'] += 1
+                return value
+
+        self.misses += 1
+        return default
+
+    def put(self, key: str, value: Any) -> str:
+        """Store `value` in every tier and return its JSON encoding"""
+        encoded = json.dumps(value, default=json_default)
+        self._remember(key, encoded)
+
+        if self.directory is not None:
+            # Write-then-rename so readers never see a partial file
+            path = self._path(key)
+            temp_path = f'{path}.{os.getpid()}.tmp'
+            with open(temp_path, 'w') as f:
+                f.write(encoded)
+            os.replace(temp_path, path)
+            self._evict_disk()
+
+        return encoded
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Cached value for `key`, computing and storing it on a miss"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = json.loads(self.put(key, compute()))
+        return value
+
+    def invalidate(self, key: str):
+        """Drop one entry from both tiers"""
+        self._memory.pop(key, None)
+        if self.directory is not None:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        self._memory.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _disk_entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+        return entries
+
+    def _evict_disk(self):
+        entries = sorted(self._disk_entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def disk_usage(self) -> int:
+        """Bytes currently held by the on-disk tier"""
+        if self.directory is None:
+            return 0
+        return sum(size for _, size, _ in self._disk_entries())
+
+    def stats(self) -> Dict[str, int]:
+        return {'memory_hits': self.hits['memory'], 'disk_hits': self.hits['disk'],
+                'misses': self.misses, 'memory_entries': len(self._memory),
+                'disk_bytes': self.disk_usage()}
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Harmonic Fusion Physics Core
+Import-light physics kernels shared by the fusion simulators
+
+Only NumPy and the standard library are imported at module load, so batch
+jobs and worker processes can use the kernels without paying for SciPy,
+pandas or matplotlib. SciPy is imported lazily, only when a ReactivityTable
+is built.
+
+Mathematics: ψ₀ = 0.915670570874434, φ = 1.618, f₀ = 432 Hz
+"""
+
+import bisect
+import math
+import numpy as np
+import logging
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+@dataclass
+class PhysicsConstants:
+    """Physical constants for fusion calculations"""
+    PSI_0: float = 0.915670570874434
+    PHI: float = 1.618033988749895
+    FREQ_432: float = 432.0
+
+    # Nuclear physics constants
+    BOLTZMANN_eV: float = 8.617e-5  # eV/K
+    ELECTRON_MASS: float = 0.511    # MeV/c²
+    PROTON_MASS: float = 938.3      # MeV/c²
+    DEUTERON_MASS: float = 1875.6   # MeV/c²
+    TRITIUM_MASS: float = 2808.4    # MeV/c²
+    ALPHA_MASS: float = 3727.4      # MeV/c²
+    NEUTRON_MASS: float = 939.6     # MeV/c²
+
+    # Electromagnetic constants
+    FINE_STRUCTURE: float = 1/137.036
+    COULOMB_CONSTANT: float = 1.44  # MeV·fm
+
+    # Plasma constants
+    PLASMA_FREQ_COEFF: float = 8.98e3  # sqrt(n_e/m_e) in rad/s
+
+@dataclass
+class PlasmaState:
+    """Current state of the plasma"""
+    __slots__ = ('temperature_keV', 'density_m3', 'magnetic_field_T', 'pressure_Pa', 'beta',
+                 'confinement_time_s')
+
+    temperature_keV: float
+    density_m3: float
+    magnetic_field_T: float
+    pressure_Pa: float
+    beta: float
+    confinement_time_s: float
+
+@dataclass
+class HarmonicState:
+    """Harmonic enhancement parameters"""
+    __slots__ = ('psi_amplitude', 'phi_amplitude', 'base_amplitude', 'coherence_factor',
+                 'resonance_match')
+
+    psi_amplitude: float
+    phi_amplitude: float
+    base_amplitude: float
+    coherence_factor: float
+    resonance_match: float
+
+@dataclass
+class TorusGeometry:
+    """φ-scaled torus gridded in normalized minor radius ρ and poloidal angle θ
+
+    The default major radius and minor radius = major/φ follow
+    wolfram_fusion_simulation.wl. Flux surfaces are circles of radius aρ whose
+    centres are pushed outward by a Shafranov shift Δ(ρ) = Δ₀(1 - ρ²), so
+    R = R₀ + Δ(ρ) + aρ cos θ and the volume element, integrated over the
+    toroidal angle, is dV = 2πR · aρ(a + Δ'(ρ) cos θ) dρ dθ. Cells are the
+    midpoints of a uniform (ρ, θ) grid.
+
+    Temperature and density are flux-surface profiles peaked on axis:
+    X(ρ) = X_edge + (X₀ - X_edge)(1 - ρ²)^peaking, with X_edge a fixed
+    fraction of the core value X₀.
+    """
+    major_radius_m: float = 2.5
+    minor_radius_m: Optional[float] = None  # default major_radius_m / φ
+    radial_cells: int = 100
+    poloidal_cells: int = 100
+    shafranov_shift_m: float = 0.0
+    temperature_peaking: float = 2.0
+    density_peaking: float = 0.5
+    edge_temperature_fraction: float = 0.1
+    edge_density_fraction: float = 0.2
+
+    def __post_init__(self):
+        if self.minor_radius_m is None:
+            self.minor_radius_m = self.major_radius_m / PhysicsConstants.PHI
+
+    @property
+    def volume_m3(self) -> float:
+        """Exact plasma volume 2π²R₀a² (the boundary surface is unshifted)"""
+        return 2 * np.pi**2 * self.major_radius_m * self.minor_radius_m**2
+
+    def cells(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(ρ, volume in m³) of every cell, both of shape (radial_cells, poloidal_cells)"""
+        a = self.minor_radius_m
+        d_rho = 1.0 / self.radial_cells
+        d_theta = 2 * np.pi / self.poloidal_cells
+        rho = ((np.arange(self.radial_cells) + 0.5) * d_rho)[:, np.newaxis]
+        cos_theta = np.cos((np.arange(self.poloidal_cells) + 0.5) * d_theta)[np.newaxis, :]
+
+        shift = self.shafranov_shift_m * (1 - rho**2)
+        shift_gradient = -2 * self.shafranov_shift_m * rho
+        major_radius = self.major_radius_m + shift + a * rho * cos_theta
+        volume = 2 * np.pi * major_radius * a * rho * (a + shift_gradient * cos_theta) * d_rho * d_theta
+
+        return np.broadcast_to(rho, volume.shape), volume
+
+    def profiles(self, core_temp_keV, core_density_m3, rho) -> Tuple[np.ndarray, np.ndarray]:
+        """Temperature and density at `rho`; core values broadcast against it
+
+        Give array-valued core values a trailing axis per `rho` dimension to get
+        one profile per core value.
+        """
+        shape = 1 - rho**2
+        core_temp_keV = np.asarray(core_temp_keV, dtype=float)
+        core_density_m3 = np.asarray(core_density_m3, dtype=float)
+
+        temperature = core_temp_keV * (self.edge_temperature_fraction +
+                                       (1 - self.edge_temperature_fraction) * shape**self.temperature_peaking)
+        density = core_density_m3 * (self.edge_density_fraction +
+                                     (1 - self.edge_density_fraction) * shape**self.density_peaking)
+        return temperature, density
+
+def configure_logging(log_file: str = 'fusion_simulation.log', level: int = logging.INFO):
+    """Send log records to the console and `log_file`
+
+    Called by the command-line entry points rather than at import time, so
+    importing the simulators never opens a log file. Does nothing if the root
+    logger already has handlers.
+    """
+    if logging.getLogger().handlers:
+        return  # checked first: basicConfig would ignore them, but only after opening log_file
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+def json_default(value):
+    """json.dump fallback for NumPy scalars and arrays"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def harmonic_arrays(harmonic) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Resolve harmonic state(s) into broadcastable (psi_amp, phi_amp, coherence) arrays
+
+    A single HarmonicState (scalar or array-valued fields) broadcasts element-wise
+    against the energy array. A sequence of HarmonicState objects gets a trailing
+    axis so the result has shape (n_states, n_energies).
+    """
+    if isinstance(harmonic, HarmonicState):
+        return (np.asarray(harmonic.psi_amplitude, dtype=float),
+                np.asarray(harmonic.phi_amplitude, dtype=float),
+                np.asarray(harmonic.coherence_factor, dtype=float))
+
+    psi_amp = np.array([h.psi_amplitude for h in harmonic], dtype=float)[:, np.newaxis]
+    phi_amp = np.array([h.phi_amplitude for h in harmonic], dtype=float)[:, np.newaxis]
+    coherence = np.array([h.coherence_factor for h in harmonic], dtype=float)[:, np.newaxis]
+    return psi_amp, phi_amp, coherence
+
+def dt_cross_section(energy_keV, constants: PhysicsConstants, psi_amplitude, phi_amplitude,
+                     coherence_factor) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized D-T cross-section returning (classical, enhanced) arrays in m²
+
+    Bosch-Hale parametrization with the energy <= 0 and theta <= 0 cut-offs
+    applied as array masks, and the ψ₀/φ Gaussian resonance enhancement.
+    Amplitude and coherence arguments broadcast against the energies.
+    """
+    energy_keV = np.asarray(energy_keV, dtype=float)
+
+    # Empirical D-T cross-section formula (Bosch-Hale parametrization)
+    A1, A2, A3, A4, A5 = 45.95, 50200, 1.368e-2, 1.076, 409.2
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        theta = energy_keV / (1 - (A2*energy_keV + A3*energy_keV**2 + A4*energy_keV**3)/(1 + A5*energy_keV))
+        valid = (energy_keV > 0) & (theta > 0)
+        safe_theta = np.where(valid, theta, 1.0)
+        safe_energy = np.where(valid, energy_keV, 1.0)
+        sigma_classical = np.where(
+            valid, A1 / (safe_energy * np.exp(A1/np.sqrt(safe_theta))), 0.0
+        ) * 1e-27  # Convert to m²
+
+    # Harmonic enhancement calculation
+    energy_MeV = energy_keV / 1000
+
+    psi_resonance = 1 + psi_amplitude * np.exp(
+        -((energy_MeV - constants.PSI_0)**2) / (2 * 0.1**2)
+    )
+    phi_resonance = 1 + phi_amplitude * np.exp(
+        -((energy_MeV - constants.PHI)**2) / (2 * 0.2**2)
+    )
+
+    sigma_enhanced = sigma_classical * (coherence_factor * psi_resonance * phi_resonance)
+    if sigma_classical.shape != sigma_enhanced.shape:
+        sigma_classical = np.broadcast_to(sigma_classical, sigma_enhanced.shape).copy()
+
+    return sigma_classical, sigma_enhanced
+
+def maxwellian_weight(energy_keV, temp_keV, constants: PhysicsConstants):
+    """Relative velocity times Maxwell-Boltzmann weight for the <σv> integrand"""
+    # Relative velocity
+    v_rel = np.sqrt(2 * energy_keV * 1.602e-16 / (constants.DEUTERON_MASS * 1.66e-27))
+    # Maxwell-Boltzmann distribution
+    mb_dist = np.sqrt(energy_keV / temp_keV) * np.exp(-energy_keV / temp_keV)
+    return v_rel * mb_dist
+
+def plasma_parameters(temp_keV, B_field, harmonic_amp, time, constants: PhysicsConstants) -> PlasmaState:
+    """Plasma state with harmonic density modulation at `time`; all inputs may be arrays"""
+
+    # Base density with harmonic modulation
+    base_density = 1e20  # m⁻³
+
+    # Harmonic density modulation
+    psi_mod = 1 + harmonic_amp * np.sin(2 * np.pi * constants.PSI_0 * time)
+    phi_mod = 1 + harmonic_amp * np.sin(2 * np.pi * constants.PHI * time / 10)
+
+    density = base_density * psi_mod * phi_mod
+
+    # Plasma pressure
+    pressure = density * temp_keV * 1.602e-16  # Pa
+
+    # Magnetic pressure
+    B_pressure = B_field**2 / (2 * 4e-7 * np.pi)  # Pa
+
+    # Plasma beta
+    beta = pressure / B_pressure
+
+    # Energy confinement time (empirical scaling)
+    confinement_time = 0.048 * (density/1e20)**0.6 * (B_field/10)**0.8 * (temp_keV/10)**0.5
+
+    return PlasmaState(
+        temperature_keV=temp_keV,
+        density_m3=density,
+        magnetic_field_T=B_field,
+        pressure_Pa=pressure,
+        beta=beta,
+        confinement_time_s=confinement_time
+    )
+
+def update_plasma_parameters(state: PlasmaState, temp_keV: float, B_field: float, harmonic_amp: float,
+                             time: float, constants: PhysicsConstants) -> PlasmaState:
+    """Scalar plasma_parameters written into `state` in place, with the same results
+
+    Uses only float arithmetic (math.sin and ** agree with their NumPy
+    counterparts bit for bit), so a tick allocates no new state object or
+    arrays.
+    """
+    psi_mod = 1 + harmonic_amp * math.sin(2 * math.pi * constants.PSI_0 * time)
+    phi_mod = 1 + harmonic_amp * math.sin(2 * math.pi * constants.PHI * time / 10)
+    density = 1e20 * psi_mod * phi_mod
+
+    state.temperature_keV = temp_keV
+    state.density_m3 = density
+    state.magnetic_field_T = B_field
+    state.pressure_Pa = density * temp_keV * 1.602e-16
+    state.beta = state.pressure_Pa / (B_field**2 / (2 * 4e-7 * math.pi))
+    state.confinement_time_s = 0.048 * (density/1e20)**0.6 * (B_field/10)**0.8 * (temp_keV/10)**0.5
+    return state
+
+class ReactivityTable:
+    """Tabulated Maxwellian reactivity <σv>(T, ψ-amp, φ-amp, coherence)
+
+    The enhanced cross-section is linear in the coherence factor and bilinear in
+    the ψ and φ resonance amplitudes, so four basis integrals per temperature
+    (amplitude corners (0,0), (1,0), (0,1), (1,1) at unit coherence) reproduce
+    the harmonic dependence exactly. Only the temperature axis is interpolated,
+    with a cubic spline in log T. `error_bound` is the largest relative deviation
+    from adaptive quadrature (epsrel=1e-8) measured at the log-midpoints of the
+    grid at build time.
+    Temperatures outside [temp_min_keV, temp_max_keV] are not covered and the
+    simulator falls back to exact quadrature for them.
+
+    Building needs SciPy; lookups only need the stored spline coefficients and
+    NumPy, so a pickled table is cheap to ship to worker processes.
+    """
+
+    BASIS_AMPLITUDES = ((0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0))
+
+    def __init__(self, temperatures: np.ndarray, basis_rates: np.ndarray, error_bound: float = np.nan):
+        from scipy import interpolate
+
+        self.temperatures = np.asarray(temperatures, dtype=float)
+        self.basis_rates = np.asarray(basis_rates, dtype=float)
+        self.temp_min_keV = float(self.temperatures[0])
+        self.temp_max_keV = float(self.temperatures[-1])
+        self.error_bound = error_bound
+
+        # Piecewise-cubic coefficients in log T, shape (4, intervals, basis)
+        spline = interpolate.CubicSpline(np.log(self.temperatures), self.basis_rates, axis=0)
+        self._knots = spline.x
+        self._coefficients = spline.c
+
+        # Plain-float copies for reactivity_scalar: per interval, the 4 basis
+        # polynomials' coefficients, highest power first
+        self._knot_list = self._knots.tolist()
+        self._coefficient_rows = np.transpose(self._coefficients, (1, 2, 0)).tolist()
+
+    @staticmethod
+    def _basis_rates(simulator, temp_keV: float) -> np.ndarray:
+        """Exact <σv> for the four amplitude corners at one temperature"""
+        from scipy import integrate
+
+        basis = [HarmonicState(psi_amplitude=a, phi_amplitude=b, base_amplitude=0.0,
+                               coherence_factor=1.0, resonance_match=0.0)
+                 for a, b in ReactivityTable.BASIS_AMPLITUDES]
+
+        def integrand(energy_keV):
+            _, sigma = simulator.calculate_dt_cross_section_batch(energy_keV, basis)
+            return sigma[:, 0] * simulator._maxwellian_weight(energy_keV, temp_keV)
+
+        rates, _ = integrate.quad_vec(integrand, 0.1, 50 * temp_keV, limit=100)
+        return rates * np.sqrt(2 / (np.pi * temp_keV))
+
+    @classmethod
+    def from_simulator(cls, simulator, temp_min_keV: float = 0.5,
+                       temp_max_keV: float = 100.0, points: int = 256) -> 'ReactivityTable':
+        """Build the table once from the simulator's cross-section model"""
+        temperatures = np.geomspace(temp_min_keV, temp_max_keV, points)
+        basis_rates = np.array([cls._basis_rates(simulator, T) for T in temperatures])
+        table = cls(temperatures, basis_rates)
+
+        # Measure interpolation error where it is largest: between grid nodes
+        midpoints = np.sqrt(temperatures[:-1] * temperatures[1:])
+        exact = np.array([cls._basis_rates(simulator, T) for T in midpoints])
+        interpolated = table._basis_at(midpoints)
+        scale = np.maximum(np.abs(exact), np.finfo(float).tiny)
+        table.error_bound = float(np.max(np.abs(interpolated - exact) / scale))
+
+        return table
+
+    def _basis_at(self, temp_keV) -> np.ndarray:
+        """Interpolated basis rates, shape (..., 4)"""
+        log_T = np.log(np.asarray(temp_keV, dtype=float))
+        interval = np.clip(np.searchsorted(self._knots, log_T, side='right') - 1,
+                           0, len(self._knots) - 2)
+        dx = (log_T - self._knots[interval])[..., np.newaxis]
+        c = self._coefficients[:, interval]
+        return ((c[0] * dx + c[1]) * dx + c[2]) * dx + c[3]
+
+    def covers(self, temp_keV) -> np.ndarray:
+        """Mask of temperatures that lie inside the tabulated range"""
+        temp_keV = np.asarray(temp_keV, dtype=float)
+        return (temp_keV >= self.temp_min_keV) & (temp_keV <= self.temp_max_keV)
+
+    @staticmethod
+    def _cubic(c, dx: float) -> float:
+        return ((c[0] * dx + c[1]) * dx + c[2]) * dx + c[3]
+
+    def reactivity_scalar(self, temp_keV: float, psi_amplitude: float, phi_amplitude: float,
+                          coherence_factor: float) -> float:
+        """reactivity() for one covered temperature, in float arithmetic without temporary arrays"""
+        log_T = np.log(temp_keV)
+        interval = min(max(bisect.bisect_right(self._knot_list, log_T) - 1, 0), len(self._knot_list) - 2)
+        dx = log_T - self._knot_list[interval]
+        rows = self._coefficient_rows[interval]
+        r00 = self._cubic(rows[0], dx)
+        r10 = self._cubic(rows[1], dx)
+        r01 = self._cubic(rows[2], dx)
+        r11 = self._cubic(rows[3], dx)
+        a, b = psi_amplitude, phi_amplitude
+        return float(coherence_factor * ((1 - a) * (1 - b) * r00 + a * (1 - b) * r10 +
+                                         (1 - a) * b * r01 + a * b * r11))
+
+    def reactivity(self, temp_keV, psi_amplitude, phi_amplitude, coherence_factor) -> np.ndarray:
+        """Interpolated <σv> in m³/s; all arguments broadcast against each other"""
+        rates = self._basis_at(temp_keV)
+        a = np.asarray(psi_amplitude, dtype=float)
+        b = np.asarray(phi_amplitude, dtype=float)
+
+        return np.asarray(coherence_factor, dtype=float) * (
+            (1 - a) * (1 - b) * rates[..., 0] +
+            a * (1 - b) * rates[..., 1] +
+            (1 - a) * b * rates[..., 2] +
+            a * b * rates[..., 3]
+        )
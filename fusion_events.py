@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Harmonic Fusion Event Log
+Coalesced, rate-limited simulation events logged off the tick path
+
+The simulators report conditions such as high beta every tick they hold.
+EventLog folds consecutive ticks of the same condition into one episode, so
+a condition that persists for 412 ticks becomes one "started" record and
+one "412 consecutive ticks" record instead of 412 lines. Records that do get
+logged are rate limited per event type by a token bucket, with the number
+suppressed carried into the next record that goes out.
+
+Log records go to the 'fusion.events' logger, whose only handler puts them
+on a queue unformatted. A single background QueueListener per process
+formats them and passes them to the root logger's handlers, so the tick
+never waits on a file or the console. Closed episodes are also kept as
+structured dicts for the comprehensive report.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+EVENT_LOGGER = 'fusion.events'
+
+# Event types: (level, description, measured quantity)
+EVENT_TYPES = {
+    'high_enhancement': (logging.INFO, 'High enhancement', 'enhancement factor'),
+    'high_beta': (logging.WARNING, 'High beta', 'beta')
+}
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread
+
+    Event records only carry numbers and strings as arguments, so they can
+    cross threads as they are.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+def start_event_listener() -> QueueListener:
+    """Start this process's event listener if it is not running; returns it"""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            event_queue = queue.SimpleQueue()
+            logger = logging.getLogger(EVENT_LOGGER)
+            for handler in list(logger.handlers):
+                if isinstance(handler, _DeferredQueueHandler):
+                    logger.removeHandler(handler)
+            logger.addHandler(_DeferredQueueHandler(event_queue))
+            logger.propagate = False
+
+            # The root logger as the listener's handler means handlers added
+            # later (configure_logging) still receive events
+            _listener = QueueListener(event_queue, logging.getLogger())
+            _listener.start()
+        return _listener
+
+def stop_event_listener():
+    """Log every queued event and stop the listener thread"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+def _forget_listener():
+    # A forked child inherits the listener object but not its thread
+    global _listener, _listener_lock
+    _listener = None
+    _listener_lock = threading.Lock()
+
+atexit.register(stop_event_listener)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_listener)
+
+class EventLog:
+    """Per-simulator episode tracker and rate-limited event emitter
+
+    During a tick, `record(kind, sim_time, value)` marks an event type as active;
+    `end_tick()` then closes the episodes of types that were not recorded
+    this tick. Both are O(1) dictionary updates; a log record is only created
+    when an episode starts or a multi-tick episode ends, and then only if the
+    type's token bucket (`rate_per_second`, up to `burst` at once) has a
+    token and its level is enabled. The latest `history` closed episodes are
+    kept.
+    """
+
+    def __init__(self, rate_per_second: float = 1.0, burst: int = 5, history: int = 1000):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.logger = logging.getLogger(EVENT_LOGGER)
+        self.episodes: deque = deque(maxlen=history)
+        self.clear()
+
+    def clear(self):
+        self.tick = 0
+        self.episodes.clear()
+        self._open: Dict[str, Dict] = {}
+        self._totals: Dict[str, Dict] = {}
+        self._tokens: Dict[str, float] = {}
+        self._refilled: Dict[str, float] = {}
+        self._unreported: Dict[str, int] = {}
+
+    def record(self, kind: str, sim_time: float, value: float):
+        """Note that event `kind` holds at simulation time `sim_time`, measuring `value`"""
+        episode = self._open.get(kind)
+        if episode is not None:
+            episode['ticks'] += 1
+            episode['end_time'] = sim_time
+            episode['last_tick'] = self.tick
+            if value > episode['peak']:
+                episode['peak'] = value
+            return
+
+        self._open[kind] = {'type': kind, 'start_time': sim_time, 'end_time': sim_time, 'ticks': 1,
+                            'peak': value, 'last_tick': self.tick}
+        level, description, quantity = EVENT_TYPES[kind]
+        self._emit(kind, level, '%s detected: %s %.3g at %.2fs', description, quantity, value, sim_time)
+
+    def end_tick(self):
+        """Close episodes not recorded during the tick that just finished"""
+        if self._open:
+            for kind in [k for k, e in self._open.items() if e['last_tick'] != self.tick]:
+                self._close(kind)
+        self.tick += 1
+
+    def flush(self):
+        """Close every open episode and report suppressed records, e.g. at the end of a run"""
+        for kind in list(self._open):
+            self._close(kind)
+        for kind, unreported in self._unreported.items():
+            start_event_listener()
+            self.logger.log(EVENT_TYPES[kind][0], '%d %s records suppressed by rate limiting',
+                            unreported, kind)
+        self._unreported.clear()
+
+    def _close(self, kind: str):
+        episode = self._open.pop(kind)
+        del episode['last_tick']
+        self.episodes.append(episode)
+
+        totals = self._totals_for(kind)
+        totals['episodes'] += 1
+        totals['ticks'] += episode['ticks']
+        totals['longest_episode_ticks'] = max(totals['longest_episode_ticks'], episode['ticks'])
+        totals['peak'] = max(totals['peak'], episode['peak'])
+
+        if episode['ticks'] > 1:
+            level, description, quantity = EVENT_TYPES[kind]
+            self._emit(kind, level, '%s for %d consecutive ticks (%.2f-%.2fs, peak %s %.3g)',
+                       description, episode['ticks'], episode['start_time'], episode['end_time'],
+                       quantity, episode['peak'])
+
+    @staticmethod
+    def _new_totals() -> Dict:
+        return {'episodes': 0, 'ticks': 0, 'longest_episode_ticks': 0, 'peak': float('-inf'),
+                'logged': 0, 'suppressed': 0}
+
+    def _totals_for(self, kind: str) -> Dict:
+        if kind not in self._totals:
+            self._totals[kind] = self._new_totals()
+        return self._totals[kind]
+
+    def _take_token(self, kind: str) -> bool:
+        now = time.monotonic()
+        tokens = self._tokens.get(kind, float(self.burst))
+        tokens = min(float(self.burst), tokens + (now - self._refilled.get(kind, now)) * self.rate_per_second)
+        self._refilled[kind] = now
+        if tokens < 1.0:
+            self._tokens[kind] = tokens
+            return False
+        self._tokens[kind] = tokens - 1.0
+        return True
+
+    def _emit(self, kind: str, level: int, message: str, *args):
+        if not self.logger.isEnabledFor(level):
+            return
+        totals = self._totals_for(kind)
+        if not self._take_token(kind):
+            totals['suppressed'] += 1
+            self._unreported[kind] = self._unreported.get(kind, 0) + 1
+            return
+
+        unreported = self._unreported.pop(kind, 0)
+        if unreported:
+            message += ' (%d earlier %s records suppressed)'
+            args += (unreported, kind)
+        totals['logged'] += 1
+
+        start_event_listener()
+        self.logger.log(level, message, *args)
+
+    def events(self) -> List[Dict]:
+        """Closed episodes, oldest first, followed by the ones still open"""
+        still_open = [{key: value for key, value in episode.items() if key != 'last_tick'}
+                      for episode in self._open.values()]
+        return [dict(episode) for episode in self.episodes] + [dict(episode, open=True) for episode in still_open]
+
+    def summary(self, recent: int = 20) -> Dict:
+        """Per-type totals and the `recent` latest episodes (open ones included)"""
+        by_type = {kind: dict(totals) for kind, totals in self._totals.items()}
+        for episode in self._open.values():
+            totals = by_type.setdefault(episode['type'], self._new_totals())
+            totals['open_episode_ticks'] = episode['ticks']
+            totals['peak'] = max(totals['peak'], episode['peak'])
+
+        return {'ticks': self.tick, 'by_type': by_type, 'recent': self.events()[-recent:]}
@@ -8,93 +8,91 @@ Mathematics: ψ₀ = 0.915670570874434, φ = 1.618, f₀ = 432 Hz
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from scipy import integrate, optimize
-from scipy.special import gamma
-import pandas as pd
 from datetime import datetime
 import json
 import logging
-from dataclasses import dataclass
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Tuple, List, Dict, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('fusion_simulation.log'),
-        logging.StreamHandler()
-    ]
-)
+# Physics kernels and state live in the import-light core; re-exported here so
+# existing `from fusion_physics_simulation import PhysicsConstants` keeps working
+from fusion_core import (HarmonicState, PhysicsConstants, PlasmaState, ReactivityTable,
+                         TorusGeometry, configure_logging, dt_cross_section, harmonic_arrays,
+                         maxwellian_weight, plasma_parameters, update_plasma_parameters)
+from fusion_cache import ResultCache, cache_key
+from fusion_events import EventLog
+from fusion_profiling import DEFAULT_TEMPERATURE_BINS, NULL_PROFILER, StageProfiler
+from fusion_telemetry import (REPORT_COLUMNS, TELEMETRY_COLUMNS, TelemetryStatistics,
+                              TelemetryStore, TelemetryStreamWriter, batch_summary,
+                              write_telemetry)
 
-@dataclass
-class PhysicsConstants:
-    """Physical constants for fusion calculations"""
-    PSI_0: float = 0.915670570874434
-    PHI: float = 1.618033988749895
-    FREQ_432: float = 432.0
-    
-    # Nuclear physics constants
-    BOLTZMANN_eV: float = 8.617e-5  # eV/K
-    ELECTRON_MASS: float = 0.511    # MeV/c²
-    PROTON_MASS: float = 938.3      # MeV/c²
-    DEUTERON_MASS: float = 1875.6   # MeV/c²
-    TRITIUM_MASS: float = 2808.4    # MeV/c²
-    ALPHA_MASS: float = 3727.4      # MeV/c²
-    NEUTRON_MASS: float = 939.6     # MeV/c²
-    
-    # Electromagnetic constants
-    FINE_STRUCTURE: float = 1/137.036
-    COULOMB_CONSTANT: float = 1.44  # MeV·fm
-    
-    # Plasma constants
-    PLASMA_FREQ_COEFF: float = 8.98e3  # sqrt(n_e/m_e) in rad/s
-
-@dataclass
-class PlasmaState:
-    """Current state of the plasma"""
-    temperature_keV: float
-    density_m3: float
-    magnetic_field_T: float
-    pressure_Pa: float
-    beta: float
-    confinement_time_s: float
-    
-@dataclass
-class HarmonicState:
-    """Harmonic enhancement parameters"""
-    psi_amplitude: float
-    phi_amplitude: float
-    base_amplitude: float
-    coherence_factor: float
-    resonance_match: float
+# SciPy (quadrature) and pandas (sweep tables) are imported inside the functions
+# that need them, keeping this module cheap to import in worker processes
 
 class FusionPhysicsSimulator:
     """Comprehensive physics simulation for harmonic fusion"""
     
-    def __init__(self, constants: PhysicsConstants = None):
+    def __init__(self, constants: PhysicsConstants = None,
+                 reactivity_table: Optional['ReactivityTable'] = None, verbose: bool = True,
+                 resonance_per_tick: bool = False, telemetry_dtype=np.float64,
+                 telemetry_capacity: Optional[int] = None, cache: Optional[ResultCache] = None,
+                 low_allocation: bool = False):
         self.constants = constants or PhysicsConstants()
         self.time = 0.0
         self.dt = 0.01  # 10ms timestep
         
-        # Telemetry storage
-        self.telemetry = {
-            'time': [],
-            'fusion_rate': [],
-            'power_output': [],
-            'cross_section': [],
-            'plasma_temp': [],
-            'plasma_density': [],
-            'magnetic_field': [],
-            'harmonic_coherence': [],
-            'enhancement_factor': [],
-            'energy_distribution': [],
-            'resonance_peaks': []
-        }
+        # Optional tabulated <σv>; None means exact quadrature every tick
+        self.reactivity_table = reactivity_table
+        
+        # Optional toroidal grid; None means the uniform plasma in a 100 m³ volume
+        self.geometry: Optional[TorusGeometry] = None
+        self._geometry_cells: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        
+        # Resonance peaks only change with the harmonic state, so they are cached
+        # and recomputed lazily; set resonance_per_tick to get fresh peaks every tick
+        self.resonance_per_tick = resonance_per_tick
+        self._resonance_cache_key = None
+        self._resonance_cache: Optional[List[Dict]] = None
+        
+        # Telemetry storage: growable columns, or a fixed-size ring buffer when
+        # telemetry_capacity is given (keeps only the latest records)
+        if telemetry_capacity is None:
+            self.telemetry = TelemetryStore(TELEMETRY_COLUMNS, dtype=telemetry_dtype)
+        else:
+            self.telemetry = TelemetryStore(TELEMETRY_COLUMNS, dtype=telemetry_dtype,
+                                            capacity=telemetry_capacity, ring=True)
+        
+        # O(1)-per-tick accumulators serving generate_comprehensive_report,
+        # windowed to the ring capacity so they describe the same records
+        self.statistics: Optional[TelemetryStatistics] = TelemetryStatistics(
+            REPORT_COLUMNS, window=telemetry_capacity
+        )
+        
+        # Optional append-only sink receiving every tick's record
+        self.telemetry_stream: Optional[TelemetryStreamWriter] = None
+        
+        # High-enhancement / high-beta episodes, coalesced and logged off the tick path
+        self.events = EventLog()
+        
+        # Per-stage timing and work counters; a no-op until enable_profiling()
+        self.profiler = NULL_PROFILER
+        
+        # Low-allocation ticks: plasma_state is updated in place, the reactivity
+        # and cross-section are evaluated in float arithmetic, and
+        # update_simulation refills and returns the same record dict every tick
+        # (copy it to keep it). For long real-time runs, with telemetry_capacity.
+        self.low_allocation = low_allocation
+        self._tick_record: Dict = {}
+        
+        # Comprehensive reports keyed by this simulator's run id, constants,
+        # harmonic state and tick count, so repeated report/save calls between
+        # ticks reuse one result; the run id keeps simulators sharing a cache apart
+        self.cache = cache if cache is not None else ResultCache(max_entries=4)
+        self._report_run_id = os.urandom(8).hex()
         
         # Current simulation state
         self.plasma_state = PlasmaState(
@@ -114,10 +112,11 @@ class FusionPhysicsSimulator:
             resonance_match=0.75
         )
         
-        logging.info("Fusion Physics Simulator initialized")
-        logging.info(f"ψ₀ = {self.constants.PSI_0}")
-        logging.info(f"φ = {self.constants.PHI}")
-        logging.info(f"Base frequency = {self.constants.FREQ_432} Hz")
+        if verbose:
+            logging.info("Fusion Physics Simulator initialized")
+            logging.info(f"ψ₀ = {self.constants.PSI_0}")
+            logging.info(f"φ = {self.constants.PHI}")
+            logging.info(f"Base frequency = {self.constants.FREQ_432} Hz")
     
     def calculate_gamow_peak(self, energy_keV: float, Z1: int = 1, Z2: int = 1, A_reduced: float = 0.5) -> float:
         """Calculate Gamow peak for nuclear tunneling probability"""
@@ -127,8 +126,10 @@ class FusionPhysicsSimulator:
         # Tunneling probability
         return np.exp(-2 * np.pi * np.sqrt(gamow_energy / energy_keV))
     
-    def calculate_dt_cross_section(self, energy_keV: float, enhanced: bool = False) -> float:
+    def calculate_dt_cross_section(self, energy_keV: float, enhanced: bool = False,
+                                   harmonic: Optional[HarmonicState] = None) -> float:
         """Calculate D-T fusion cross-section with optional harmonic enhancement"""
+        harmonic = harmonic or self.harmonic_state
         
         # Classical Gamow-peak based cross-section
         if energy_keV <= 0:
@@ -154,42 +155,143 @@ class FusionPhysicsSimulator:
         energy_MeV = energy_keV / 1000
         
         # ψ₀ resonance enhancement
-        psi_resonance = 1 + self.harmonic_state.psi_amplitude * np.exp(
+        psi_resonance = 1 + harmonic.psi_amplitude * np.exp(
             -((energy_MeV - self.constants.PSI_0)**2) / (2 * 0.1**2)
         )
         
         # φ resonance enhancement  
-        phi_resonance = 1 + self.harmonic_state.phi_amplitude * np.exp(
+        phi_resonance = 1 + harmonic.phi_amplitude * np.exp(
             -((energy_MeV - self.constants.PHI)**2) / (2 * 0.2**2)
         )
         
         # Coherence factor
-        coherence = self.harmonic_state.coherence_factor
+        coherence = harmonic.coherence_factor
         
         # Total enhancement
         enhancement_factor = coherence * psi_resonance * phi_resonance
         
         return sigma_classical * enhancement_factor * 1e-27  # Convert to m²
+
+    def _harmonic_arrays(self, harmonic=None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Broadcastable (psi_amp, phi_amp, coherence) arrays; see fusion_core.harmonic_arrays"""
+        return harmonic_arrays(self.harmonic_state if harmonic is None else harmonic)
+    
+    def calculate_dt_cross_section_batch(self, energy_keV, harmonic=None) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized D-T cross-section returning (classical, enhanced) arrays in m²
+        
+        Same Bosch-Hale parametrization and resonance model as calculate_dt_cross_section,
+        with the energy <= 0 and theta <= 0 cut-offs applied as array masks.
+        `harmonic` is a HarmonicState, a HarmonicState with array fields, or a sequence
+        of HarmonicState objects (defaults to the simulator's current harmonic state).
+        """
+        self.profiler.count('cross_section_calls')
+        psi_amp, phi_amp, coherence = self._harmonic_arrays(harmonic)
+        return dt_cross_section(energy_keV, self.constants, psi_amp, phi_amp, coherence)
+    
+    def _maxwellian_weight(self, energy_keV, temp_keV):
+        """Relative velocity times Maxwell-Boltzmann weight for the <σv> integrand"""
+        return maxwellian_weight(energy_keV, temp_keV, self.constants)
+    
+    def calculate_reactivity(self, temp_keV: float, harmonic: Optional[HarmonicState] = None) -> float:
+        """Maxwell-Boltzmann averaged reactivity <σv> in m³/s
+        
+        Read from self.reactivity_table when one is attached and covers temp_keV,
+        otherwise integrated exactly with adaptive quadrature.
+        """
+        harmonic = harmonic or self.harmonic_state
+        
+        table = self.reactivity_table
+        if table is not None and self.low_allocation and table.temp_min_keV <= temp_keV <= table.temp_max_keV:
+            self.profiler.count('table_lookups')
+            return table.reactivity_scalar(temp_keV, harmonic.psi_amplitude,
+                                           harmonic.phi_amplitude, harmonic.coherence_factor)
+        if table is not None and table.covers(temp_keV):
+            self.profiler.count('table_lookups')
+            return float(table.reactivity(temp_keV, harmonic.psi_amplitude,
+                                          harmonic.phi_amplitude, harmonic.coherence_factor))
+        
+        return self._reactivity_quad(temp_keV, harmonic)
+    
+    def calculate_reactivity_batch(self, temp_keV, harmonic=None) -> np.ndarray:
+        """Vectorized <σv> over arrays of temperatures and/or harmonic states
+        
+        Elements inside the reactivity table are interpolated in one array
+        operation; the rest fall back to exact quadrature one element at a time.
+        """
+        psi_amp, phi_amp, coherence = self._harmonic_arrays(harmonic)
+        temp_keV, psi_amp, phi_amp, coherence = np.broadcast_arrays(
+            np.asarray(temp_keV, dtype=float), psi_amp, phi_amp, coherence
+        )
+        shape = temp_keV.shape
+        temp_keV, psi_amp, phi_amp, coherence = (
+            a.ravel() for a in (temp_keV, psi_amp, phi_amp, coherence)
+        )
+        
+        rates = np.empty(temp_keV.shape)
+        table = self.reactivity_table
+        inside = table.covers(temp_keV) if table is not None else np.zeros(temp_keV.shape, dtype=bool)
+        if inside.any():
+            self.profiler.count('table_lookups', int(np.count_nonzero(inside)))
+            rates[inside] = table.reactivity(temp_keV[inside], psi_amp[inside],
+                                             phi_amp[inside], coherence[inside])
+        
+        for i in np.flatnonzero(~inside):
+            harmonic_i = HarmonicState(psi_amplitude=psi_amp[i], phi_amplitude=phi_amp[i],
+                                       base_amplitude=0.0, coherence_factor=coherence[i],
+                                       resonance_match=0.0)
+            rates[i] = self._reactivity_quad(temp_keV[i], harmonic_i)
+        
+        return rates.reshape(shape)
+    
+    def _reactivity_integrand(self, energy_keV: float, temp_keV: float, harmonic: HarmonicState) -> float:
+        sigma = self.calculate_dt_cross_section(energy_keV, enhanced=True, harmonic=harmonic)
+        return sigma * self._maxwellian_weight(energy_keV, temp_keV)
+    
+    def _reactivity_quad(self, temp_keV: float, harmonic: HarmonicState) -> float:
+        """Exact <σv> by adaptive quadrature over [0.1, 50 T] keV
+        
+        Each integrand evaluation is one scalar cross-section call, so when
+        profiling, quad's own evaluation count is charged to both counters.
+        """
+        from scipy import integrate
+        
+        # Integrate over energy distribution; the integrand is a method taking
+        # its temperature and harmonic state as quad args, not a new closure
+        args = (temp_keV, harmonic)
+        if self.profiler.enabled:
+            rate_coeff, _, info = integrate.quad(self._reactivity_integrand, 0.1, 50 * temp_keV, args=args,
+                                                 limit=100, full_output=1)[:3]
+            self.profiler.count('quad_calls')
+            self.profiler.count('quad_evaluations', info['neval'])
+            self.profiler.count('cross_section_calls', info['neval'])
+        else:
+            rate_coeff, _ = integrate.quad(self._reactivity_integrand, 0.1, 50 * temp_keV, args=args, limit=100)
+        return rate_coeff * np.sqrt(2 / (np.pi * temp_keV))  # Normalization
+    
+    def enable_reactivity_table(self, **table_options) -> 'ReactivityTable':
+        """Build and attach a ReactivityTable so calculate_fusion_rate becomes a lookup"""
+        self.reactivity_table = ReactivityTable.from_simulator(self, **table_options)
+        logging.info(f"Reactivity table built: {len(self.reactivity_table.temperatures)} points, "
+                     f"{self.reactivity_table.temp_min_keV}-{self.reactivity_table.temp_max_keV} keV, "
+                     f"interpolation error bound {self.reactivity_table.error_bound:.2e}")
+        return self.reactivity_table
     
     def calculate_fusion_rate(self, plasma: PlasmaState, harmonic: HarmonicState) -> Tuple[float, float]:
-        """Calculate fusion reaction rate and power output"""
+        """Calculate fusion reaction rate and power output
+        
+        With a spatial model enabled, see calculate_spatial_fusion_rate.
+        """
+        if self.geometry is not None:
+            return self.calculate_spatial_fusion_rate(plasma, harmonic)
         
         # Temperature-dependent reaction rate calculation
-        temp_keV = plasma.temperature_keV
         density = plasma.density_m3
         
-        # Maxwell-Boltzmann averaged reaction rate
-        def integrand(energy_keV):
-            sigma = self.calculate_dt_cross_section(energy_keV, enhanced=True)
-            # Relative velocity
-            v_rel = np.sqrt(2 * energy_keV * 1.602e-16 / (self.constants.DEUTERON_MASS * 1.66e-27))
-            # Maxwell-Boltzmann distribution
-            mb_dist = np.sqrt(energy_keV / temp_keV) * np.exp(-energy_keV / temp_keV)
-            return sigma * v_rel * mb_dist
-        
-        # Integrate over energy distribution
-        rate_coeff, _ = integrate.quad(integrand, 0.1, 50 * temp_keV, limit=100)
-        rate_coeff *= np.sqrt(2 / (np.pi * temp_keV))  # Normalization
+        # Maxwell-Boltzmann averaged reaction rate (batched for array-valued states)
+        if np.ndim(plasma.temperature_keV):
+            rate_coeff = self.calculate_reactivity_batch(plasma.temperature_keV, harmonic)
+        else:
+            rate_coeff = self.calculate_reactivity(plasma.temperature_keV, harmonic)
         
         # Reaction rate (assuming 50-50 D-T mixture)
         n_D = n_T = density / 2
@@ -204,38 +306,71 @@ class FusionPhysicsSimulator:
         
         return reaction_rate, total_power
     
-    def calculate_plasma_parameters(self, temp_keV: float, B_field: float, harmonic_amp: float) -> PlasmaState:
-        """Calculate comprehensive plasma parameters"""
-        
-        # Base density with harmonic modulation
-        base_density = 1e20  # m⁻³
+    def calculate_spatial_fusion_rate(self, plasma: PlasmaState, harmonic: HarmonicState):
+        """Volume-averaged reaction rate (reactions/m³/s) and total power (MW) over self.geometry
         
-        # Harmonic density modulation
-        psi_mod = 1 + harmonic_amp * np.sin(2 * np.pi * self.constants.PSI_0 * self.time)
-        phi_mod = 1 + harmonic_amp * np.sin(2 * np.pi * self.constants.PHI * self.time / 10)
+        The plasma state's temperature and density are taken as the on-axis
+        values of the geometry's profiles. Local <σv> for every cell comes from
+        one calculate_reactivity_batch call (a single table lookup when the
+        table covers the edge temperature) and power is summed over the cell
+        volumes. Array-valued states (ensembles) get one profile per member.
+        """
+        rho, volume = self._geometry_cells
+        temperature, density = self.geometry.profiles(
+            np.asarray(plasma.temperature_keV, dtype=float)[..., np.newaxis, np.newaxis],
+            np.asarray(plasma.density_m3, dtype=float)[..., np.newaxis, np.newaxis],
+            rho
+        )
         
-        density = base_density * psi_mod * phi_mod
+        # Harmonic amplitudes get the same trailing grid axes as the profiles
+        psi_amp, phi_amp, coherence = (a[..., np.newaxis, np.newaxis] for a in self._harmonic_arrays(harmonic))
+        local_harmonic = HarmonicState(psi_amplitude=psi_amp, phi_amplitude=phi_amp, base_amplitude=0.0,
+                                       coherence_factor=coherence, resonance_match=0.0)
+        rate_coeff = self.calculate_reactivity_batch(temperature, local_harmonic)
+        self.profiler.count('spatial_cells', rate_coeff.size)
         
-        # Plasma pressure
-        pressure = density * temp_keV * 1.602e-16  # Pa
+        # 50-50 D-T mixture, 17.6 MeV per reaction
+        reactions = np.sum((density / 2)**2 * rate_coeff * volume, axis=(-2, -1))  # reactions/s
+        total_volume = np.sum(volume)
+        total_power = reactions * 17.6 * 1.602e-13 / 1e6  # MW
         
-        # Magnetic pressure
-        B_pressure = B_field**2 / (2 * 4e-7 * np.pi)  # Pa
+        return reactions / total_volume, total_power
+    
+    def enable_spatial_model(self, geometry: Optional[TorusGeometry] = None,
+                             min_core_temp_keV: float = 1.0) -> TorusGeometry:
+        """Integrate fusion power over a toroidal (ρ, θ) grid instead of a uniform 100 m³ plasma
         
-        # Plasma beta
-        beta = pressure / B_pressure
+        Cells outside the reactivity table fall back to one quadrature call
+        each, and edge cells run at edge_temperature_fraction of the core
+        temperature. So unless the attached table already reaches that
+        fraction of `min_core_temp_keV` (default: the sweep's lowest
+        temperature), a table is built, or rebuilt over the same upper range,
+        down to it.
+        """
+        self.geometry = geometry or TorusGeometry()
+        self._geometry_cells = self.geometry.cells()
         
-        # Energy confinement time (empirical scaling)
-        confinement_time = 0.048 * (density/1e20)**0.6 * (B_field/10)**0.8 * (temp_keV/10)**0.5
+        edge_temp_keV = self.geometry.edge_temperature_fraction * min_core_temp_keV
+        table = self.reactivity_table
+        if table is None or table.temp_min_keV > edge_temp_keV:
+            table_options = {'temp_min_keV': edge_temp_keV}
+            if table is not None:
+                table_options['temp_max_keV'] = table.temp_max_keV
+            self.enable_reactivity_table(**table_options)
         
-        return PlasmaState(
-            temperature_keV=temp_keV,
-            density_m3=density,
-            magnetic_field_T=B_field,
-            pressure_Pa=pressure,
-            beta=beta,
-            confinement_time_s=confinement_time
-        )
+        logging.info(f"Spatial model: R₀ = {self.geometry.major_radius_m} m, "
+                     f"a = {self.geometry.minor_radius_m:.3f} m, V = {self.geometry.volume_m3:.1f} m³, "
+                     f"{self.geometry.radial_cells}×{self.geometry.poloidal_cells} cells")
+        return self.geometry
+    
+    def disable_spatial_model(self):
+        """Return to the uniform-plasma fusion rate"""
+        self.geometry = None
+        self._geometry_cells = None
+    
+    def calculate_plasma_parameters(self, temp_keV: float, B_field: float, harmonic_amp: float) -> PlasmaState:
+        """Calculate comprehensive plasma parameters"""
+        return plasma_parameters(temp_keV, B_field, harmonic_amp, self.time, self.constants)
     
     def calculate_energy_distribution(self, temp_keV: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Calculate particle energy distributions"""
@@ -279,30 +414,90 @@ class FusionPhysicsSimulator:
             'base_spectrum': base_spectrum
         }
     
-    def detect_resonance_peaks(self) -> List[Dict]:
-        """Detect and analyze resonance peaks"""
-        energies = np.linspace(0.1, 10, 100)
-        cross_sections = [self.calculate_dt_cross_section(E * 1000, enhanced=True) for E in energies]
+    def detect_resonance_peaks(self, energies: Optional[np.ndarray] = None,
+                               tolerance_MeV: Optional[float] = None,
+                               harmonic: Optional[HarmonicState] = None) -> List[Dict]:
+        """Detect and analyze resonance peaks on `energies` (MeV, default 100 points on 0.1-10)
+        
+        Local maxima are found on the grid in one vectorized pass. With
+        `tolerance_MeV`, each one is then refined by bounded Brent maximization
+        of the enhanced cross-section between its two grid neighbours, so the
+        peak energy is located to within the tolerance for a few dozen extra
+        evaluations per peak instead of a grid that fine. Refined peaks also
+        report 'energy_tolerance_MeV' and 'evaluations' (coarse grid included).
+        `harmonic` is a scalar HarmonicState (default: the current harmonic state).
+        """
+        if energies is None:
+            energies = np.linspace(0.1, 10, 100)
+        energies = np.asarray(energies, dtype=float)
+        classical, cross_sections = self.calculate_dt_cross_section_batch(energies * 1000, harmonic)
+        
+        # Find peaks (interior local maxima above 10% of the global maximum)
+        interior = cross_sections[1:-1]
+        is_peak = ((interior > cross_sections[:-2]) & (interior > cross_sections[2:]) &
+                   (interior > np.max(cross_sections) * 0.1))  # Significant peaks only
         
-        # Find peaks
         peaks = []
-        for i in range(1, len(cross_sections) - 1):
-            if cross_sections[i] > cross_sections[i-1] and cross_sections[i] > cross_sections[i+1]:
-                if cross_sections[i] > np.max(cross_sections) * 0.1:  # Significant peaks only
-                    enhancement = cross_sections[i] / self.calculate_dt_cross_section(energies[i] * 1000, enhanced=False)
-                    peaks.append({
-                        'energy_MeV': energies[i],
-                        'cross_section': cross_sections[i],
-                        'enhancement_factor': enhancement,
-                        'is_psi_resonance': abs(energies[i] - self.constants.PSI_0) < 0.1,
-                        'is_phi_resonance': abs(energies[i] - self.constants.PHI) < 0.1
-                    })
+        for i in np.flatnonzero(is_peak) + 1:
+            energy, sigma, sigma_classical = energies[i], cross_sections[i], classical[i]
+            peak = {}
+            
+            if tolerance_MeV is not None:
+                energy, evaluations = self._refine_resonance_peak(energies[i - 1], energies[i + 1],
+                                                                  tolerance_MeV, harmonic)
+                sigma_classical, sigma = (float(a) for a in self.calculate_dt_cross_section_batch(energy * 1000,
+                                                                                                  harmonic))
+                peak = {'energy_tolerance_MeV': tolerance_MeV, 'evaluations': len(energies) + evaluations + 1}
+            
+            with np.errstate(divide='ignore', invalid='ignore'):
+                enhancement = np.float64(sigma) / sigma_classical
+            peaks.append({
+                'energy_MeV': energy,
+                'cross_section': sigma,
+                'enhancement_factor': enhancement,
+                'is_psi_resonance': abs(energy - self.constants.PSI_0) < 0.1,
+                'is_phi_resonance': abs(energy - self.constants.PHI) < 0.1,
+                **peak
+            })
         
         return peaks
     
+    def _refine_resonance_peak(self, lower_MeV: float, upper_MeV: float, tolerance_MeV: float,
+                               harmonic: Optional[HarmonicState] = None) -> Tuple[float, int]:
+        """Energy of the cross-section maximum bracketed by [lower, upper], and evaluations used"""
+        from scipy import optimize
+        
+        def negative_cross_section(energy_MeV):
+            return -float(self.calculate_dt_cross_section_batch(energy_MeV * 1000, harmonic)[1])
+        
+        result = optimize.minimize_scalar(negative_cross_section, bounds=(lower_MeV, upper_MeV),
+                                          method='bounded', options={'xatol': tolerance_MeV})
+        return float(result.x), int(result.nfev)
+    
+    def _resonance_key(self) -> Tuple[float, ...]:
+        """Inputs that determine the resonance peaks"""
+        return (self.harmonic_state.psi_amplitude, self.harmonic_state.phi_amplitude,
+                self.harmonic_state.coherence_factor, self.constants.PSI_0, self.constants.PHI)
+    
+    @property
+    def resonance_peaks(self) -> List[Dict]:
+        """Resonance peaks for the current harmonic state, recomputed only when it changes"""
+        key = self._resonance_key()
+        if key != self._resonance_cache_key:
+            self._resonance_cache = self.detect_resonance_peaks()
+            self._resonance_cache_key = key
+        return self._resonance_cache
+    
+    def invalidate_resonance_peaks(self):
+        """Drop the cached resonance peaks so the next access recomputes them"""
+        self._resonance_cache_key = None
+        self._resonance_cache = None
+    
     def update_simulation(self, temp_keV: float = None, B_field: float = None, 
                          harmonic_amp: float = None) -> Dict:
         """Update simulation state and calculate all parameters"""
+        profiler = self.profiler
+        mark = profiler.start()
         
         # Update parameters if provided
         if temp_keV is not None:
@@ -315,79 +510,192 @@ class FusionPhysicsSimulator:
             self.harmonic_state.base_amplitude = harmonic_amp * 0.6
         
         # Calculate plasma state
-        self.plasma_state = self.calculate_plasma_parameters(
-            self.plasma_state.temperature_keV,
-            self.plasma_state.magnetic_field_T,
-            self.harmonic_state.psi_amplitude
-        )
+        if self.low_allocation:
+            update_plasma_parameters(self.plasma_state, self.plasma_state.temperature_keV,
+                                     self.plasma_state.magnetic_field_T, self.harmonic_state.psi_amplitude,
+                                     self.time, self.constants)
+        else:
+            self.plasma_state = self.calculate_plasma_parameters(
+                self.plasma_state.temperature_keV,
+                self.plasma_state.magnetic_field_T,
+                self.harmonic_state.psi_amplitude
+            )
+        
+        mark = profiler.lap('plasma_parameters', mark)
         
         # Calculate fusion metrics
         reaction_rate, power_output = self.calculate_fusion_rate(self.plasma_state, self.harmonic_state)
+        mark = profiler.lap('fusion_rate', mark)
         
         # Calculate enhancement factor
-        classical_cs = self.calculate_dt_cross_section(self.plasma_state.temperature_keV * 1000, enhanced=False)
-        enhanced_cs = self.calculate_dt_cross_section(self.plasma_state.temperature_keV * 1000, enhanced=True)
+        if self.low_allocation:
+            energy_keV = self.plasma_state.temperature_keV * 1000
+            self.profiler.count('cross_section_calls', 2)
+            classical_cs = float(self.calculate_dt_cross_section(energy_keV))
+            enhanced_cs = float(self.calculate_dt_cross_section(energy_keV, enhanced=True))
+        else:
+            classical_cs, enhanced_cs = self.calculate_dt_cross_section_batch(self.plasma_state.temperature_keV * 1000)
+            classical_cs, enhanced_cs = float(classical_cs), float(enhanced_cs)
         enhancement_factor = enhanced_cs / max(classical_cs, 1e-50)
+        mark = profiler.lap('cross_section', mark)
         
         # Calculate harmonic coherence
         harmonic_coherence = (self.harmonic_state.psi_amplitude + 
                             self.harmonic_state.phi_amplitude + 
                             self.harmonic_state.base_amplitude) / 3 * self.harmonic_state.coherence_factor
         
-        # Store telemetry
-        telemetry_data = {
-            'time': self.time,
-            'fusion_rate': reaction_rate,
-            'power_output': power_output,
-            'cross_section': enhanced_cs,
-            'plasma_temp': self.plasma_state.temperature_keV,
-            'plasma_density': self.plasma_state.density_m3,
-            'magnetic_field': self.plasma_state.magnetic_field_T,
-            'plasma_beta': self.plasma_state.beta,
-            'confinement_time': self.plasma_state.confinement_time_s,
-            'harmonic_coherence': harmonic_coherence,
-            'enhancement_factor': enhancement_factor,
-            'resonance_peaks': self.detect_resonance_peaks()
-        }
+        # Store telemetry (refilling the one reused record in low-allocation mode)
+        telemetry_data = self._tick_record if self.low_allocation else {}
+        telemetry_data['time'] = self.time
+        telemetry_data['fusion_rate'] = reaction_rate
+        telemetry_data['power_output'] = power_output
+        telemetry_data['cross_section'] = enhanced_cs
+        telemetry_data['plasma_temp'] = self.plasma_state.temperature_keV
+        telemetry_data['plasma_density'] = self.plasma_state.density_m3
+        telemetry_data['magnetic_field'] = self.plasma_state.magnetic_field_T
+        telemetry_data['plasma_beta'] = self.plasma_state.beta
+        telemetry_data['confinement_time'] = self.plasma_state.confinement_time_s
+        telemetry_data['harmonic_coherence'] = harmonic_coherence
+        telemetry_data['enhancement_factor'] = enhancement_factor
+        
+        # Opt-in per-tick peak detection (otherwise read the cached resonance_peaks property)
+        if self.resonance_per_tick:
+            telemetry_data['resonance_peaks'] = self.detect_resonance_peaks()
+            mark = profiler.lap('resonance_peaks', mark)
         
         # Append to telemetry history
-        for key, value in telemetry_data.items():
-            if key != 'resonance_peaks':
-                self.telemetry[key].append(value)
+        self.telemetry.append(telemetry_data)
+        self.statistics.update(telemetry_data)
+        if self.telemetry_stream is not None:
+            # The writer thread serializes later, after the reused record has moved on
+            self.telemetry_stream.submit(dict(telemetry_data) if self.low_allocation else telemetry_data)
         
         # Log significant events
         if enhancement_factor > 10:
-            logging.info(f"High enhancement detected: {enhancement_factor:.1f}x at {self.time:.2f}s")
+            self.events.record('high_enhancement', self.time, enhancement_factor)
         
         if self.plasma_state.beta > 0.1:
-            logging.warning(f"High beta detected: {self.plasma_state.beta:.3f} at {self.time:.2f}s")
+            self.events.record('high_beta', self.time, self.plasma_state.beta)
+        self.events.end_tick()
+        
+        profiler.lap('telemetry', mark)
+        profiler.end_tick(self.plasma_state.temperature_keV)
         
         self.time += self.dt
         
         return telemetry_data
     
+    @staticmethod
+    def _schedule_values(schedule, times: np.ndarray, current) -> np.ndarray:
+        """Schedule resolved to one value per time: None holds `current`, callables get `times`"""
+        if schedule is None:
+            schedule = current
+        elif callable(schedule):
+            schedule = schedule(times)
+        return np.broadcast_to(np.asarray(schedule, dtype=float), times.shape)
+    
+    def simulate_trajectory(self, times, temp_keV=None, B_field=None, harmonic_amp=None) -> Dict[str, np.ndarray]:
+        """Telemetry columns for a whole run, evaluated at every time in one batch
+        
+        Each schedule is a scalar, an array with one value per time, a callable
+        taking the time array, or None to hold the current state's value.
+        Every time point is computed exactly as update_simulation would compute
+        a tick at that time with those parameters, but with array operations:
+        one reactivity table lookup for the whole run when an attached table
+        covers every temperature, and otherwise one quadrature call per
+        uncovered time point, as in calculate_reactivity_batch. The simulator's
+        state, clock and telemetry are left untouched; the result has the same
+        keys as the step loop's records.
+        """
+        times = np.asarray(times, dtype=float)
+        temperature = self._schedule_values(temp_keV, times, self.plasma_state.temperature_keV)
+        magnetic_field = self._schedule_values(B_field, times, self.plasma_state.magnetic_field_T)
+        
+        if harmonic_amp is None:
+            psi_amp = self._schedule_values(None, times, self.harmonic_state.psi_amplitude)
+            phi_amp = self._schedule_values(None, times, self.harmonic_state.phi_amplitude)
+            base_amp = self._schedule_values(None, times, self.harmonic_state.base_amplitude)
+        else:
+            psi_amp = self._schedule_values(harmonic_amp, times, None)
+            phi_amp = psi_amp * 0.8
+            base_amp = psi_amp * 0.6
+        
+        harmonic = HarmonicState(
+            psi_amplitude=psi_amp,
+            phi_amplitude=phi_amp,
+            base_amplitude=base_amp,
+            coherence_factor=self.harmonic_state.coherence_factor,
+            resonance_match=self.harmonic_state.resonance_match
+        )
+        plasma = plasma_parameters(temperature, magnetic_field, psi_amp, times, self.constants)
+        
+        reaction_rate, power_output = self.calculate_fusion_rate(plasma, harmonic)
+        classical_cs, enhanced_cs = self.calculate_dt_cross_section_batch(temperature * 1000, harmonic)
+        
+        return {
+            'time': times,
+            'fusion_rate': reaction_rate,
+            'power_output': power_output,
+            'cross_section': enhanced_cs,
+            'plasma_temp': temperature,
+            'plasma_density': plasma.density_m3,
+            'magnetic_field': magnetic_field,
+            'plasma_beta': plasma.beta,
+            'confinement_time': plasma.confinement_time_s,
+            'harmonic_coherence': (psi_amp + phi_amp + base_amp) / 3 * harmonic.coherence_factor,
+            'enhancement_factor': enhanced_cs / np.maximum(classical_cs, 1e-50)
+        }
+    
+    def report_cache_key(self) -> str:
+        """Cache key of the comprehensive report for the current telemetry
+        
+        O(1): telemetry only ever changes by appending ticks, so the number
+        appended (with the clock and run id) identifies its contents without
+        hashing the columns.
+        """
+        return cache_key('comprehensive_report', self._report_run_id, self.constants, self.harmonic_state,
+                         self.geometry, self.time, self.telemetry.total_appended, len(self.telemetry))
+    
     def generate_comprehensive_report(self) -> Dict:
-        """Generate comprehensive analysis report"""
-        if len(self.telemetry['time']) < 10:
+        """Generate comprehensive analysis report
+        
+        Served from self.cache while the telemetry and harmonic state are
+        unchanged; the profiling (if enabled) and events sections are always current.
+        """
+        if len(self.telemetry) < 10:
             logging.warning("Insufficient data for comprehensive analysis")
             return {}
         
-        # Statistical analysis
-        avg_enhancement = np.mean(self.telemetry['enhancement_factor'])
-        max_enhancement = np.max(self.telemetry['enhancement_factor'])
-        avg_power = np.mean(self.telemetry['power_output'])
-        max_power = np.max(self.telemetry['power_output'])
+        report = self.cache.get_or_compute(self.report_cache_key(), self._compute_comprehensive_report)
+        
+        if self.profiler.enabled:
+            report['profiling'] = self.profiler.summary()
+        report['events'] = self.events.summary()
         
-        # Peak detection
-        resonance_peaks = self.detect_resonance_peaks()
+        return report
+    
+    def _compute_comprehensive_report(self) -> Dict:
+        """Statistics, stability and resonance analysis over the recorded telemetry"""
+        # Served from the streaming accumulators when available; otherwise a batch
+        # pass over the raw (order-independent, copy-free) telemetry columns
+        if self.statistics is not None:
+            stats = self.statistics.summary()
+        else:
+            stats = batch_summary(self.telemetry, REPORT_COLUMNS)
+        
+        # Statistical analysis
+        avg_enhancement = stats['enhancement_factor']['mean']
+        max_enhancement = stats['enhancement_factor']['max']
+        avg_power = stats['power_output']['mean']
+        max_power = stats['power_output']['max']
         
         # Stability analysis
-        temp_stability = np.std(self.telemetry['plasma_temp']) / np.mean(self.telemetry['plasma_temp'])
-        density_stability = np.std(self.telemetry['plasma_density']) / np.mean(self.telemetry['plasma_density'])
+        temp_stability = stats['plasma_temp']['std'] / stats['plasma_temp']['mean']
+        density_stability = stats['plasma_density']['std'] / stats['plasma_density']['mean']
         
         report = {
             'simulation_duration': self.time,
-            'data_points': len(self.telemetry['time']),
+            'data_points': len(self.telemetry),
             'performance_metrics': {
                 'average_enhancement_factor': avg_enhancement,
                 'maximum_enhancement_factor': max_enhancement,
@@ -398,14 +706,9 @@ class FusionPhysicsSimulator:
             'stability_metrics': {
                 'temperature_stability': 1 - temp_stability,
                 'density_stability': 1 - density_stability,
-                'plasma_beta_range': [np.min(self.telemetry['plasma_beta']), np.max(self.telemetry['plasma_beta'])]
-            },
-            'resonance_analysis': {
-                'peak_count': len(resonance_peaks),
-                'psi_resonances': len([p for p in resonance_peaks if p['is_psi_resonance']]),
-                'phi_resonances': len([p for p in resonance_peaks if p['is_phi_resonance']]),
-                'max_peak_enhancement': max([p['enhancement_factor'] for p in resonance_peaks]) if resonance_peaks else 0
+                'plasma_beta_range': [stats['plasma_beta']['min'], stats['plasma_beta']['max']]
             },
+            'resonance_analysis': self._resonance_analysis(),
             'mathematical_constants': {
                 'psi_0': self.constants.PSI_0,
                 'phi': self.constants.PHI,
@@ -413,76 +716,670 @@ class FusionPhysicsSimulator:
             }
         }
         
+        if self.geometry is not None:
+            report['geometry'] = {
+                'major_radius_m': self.geometry.major_radius_m,
+                'minor_radius_m': self.geometry.minor_radius_m,
+                'volume_m3': self.geometry.volume_m3,
+                'cells': self._geometry_cells[1].size
+            }
+        
         return report
     
-    def save_telemetry(self, filename: str = None):
-        """Save telemetry data to file"""
+    def _resonance_analysis(self) -> Dict:
+        """Report section summarising the resonance peaks (cached until the harmonic state changes)"""
+        return self._summarize_peaks(self.resonance_peaks)
+    
+    @staticmethod
+    def _summarize_peaks(resonance_peaks: List[Dict]) -> Dict:
+        return {
+            'peak_count': len(resonance_peaks),
+            'psi_resonances': len([p for p in resonance_peaks if p['is_psi_resonance']]),
+            'phi_resonances': len([p for p in resonance_peaks if p['is_phi_resonance']]),
+            'max_peak_enhancement': max([p['enhancement_factor'] for p in resonance_peaks]) if resonance_peaks else 0
+        }
+    
+    def enable_profiling(self, temperature_bins=DEFAULT_TEMPERATURE_BINS) -> StageProfiler:
+        """Start recording per-stage wall time and work counters for every tick
+        
+        Stage times, quadrature evaluation counts and cross-section call counts
+        go into histograms on the returned StageProfiler (also self.profiler)
+        and are summarised under 'profiling' in generate_comprehensive_report.
+        """
+        self.profiler = StageProfiler(temperature_bins)
+        return self.profiler
+    
+    def disable_profiling(self):
+        """Stop profiling and return the profiler with everything recorded so far"""
+        profiler, self.profiler = self.profiler, NULL_PROFILER
+        return profiler
+    
+    def attach_telemetry_stream(self, filename: str, **writer_options) -> TelemetryStreamWriter:
+        """Stream every tick to an append-only JSON Lines file from a background thread"""
+        self.detach_telemetry_stream()
+        self.telemetry_stream = TelemetryStreamWriter(filename, **writer_options)
+        logging.info(f"Streaming telemetry to {filename}")
+        return self.telemetry_stream
+    
+    def detach_telemetry_stream(self):
+        """Flush and close the attached telemetry stream, if any"""
+        if self.telemetry_stream is not None:
+            self.telemetry_stream.close()
+            if self.telemetry_stream.dropped:
+                logging.warning(f"Telemetry stream dropped {self.telemetry_stream.dropped} records (queue full)")
+            self.telemetry_stream = None
+    
+    def save_telemetry(self, filename: str = None, format: Optional[str] = None,
+                       report: Optional[Dict] = None):
+        """Save telemetry data to file
+        
+        format is 'json', 'npz' (compressed, column-wise) or 'parquet' (column-wise,
+        needs pyarrow); by default it follows the filename extension, else JSON.
+        The comprehensive report (pass `report` to store one already generated)
+        is stored alongside the columns in every format.
+        Read files back with fusion_telemetry.load_telemetry.
+        """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"fusion_telemetry_{timestamp}.json"
+            filename = f"fusion_telemetry_{timestamp}.{format or 'json'}"
         
-        # Convert numpy arrays to lists for JSON serialization
-        telemetry_json = {}
-        for key, values in self.telemetry.items():
-            if isinstance(values, list) and len(values) > 0:
-                if isinstance(values[0], (np.integer, np.floating)):
-                    telemetry_json[key] = [float(v) for v in values]
-                else:
-                    telemetry_json[key] = values
+        if report is None:
+            report = self.generate_comprehensive_report()
         
-        # Add comprehensive report
-        telemetry_json['analysis_report'] = self.generate_comprehensive_report()
-        
-        with open(filename, 'w') as f:
-            json.dump(telemetry_json, f, indent=2)
+        write_telemetry(filename, dict(self.telemetry.items()), report, format)
         
         logging.info(f"Telemetry saved to {filename}")
         return filename
 
-def run_parameter_sweep():
-    """Run parameter sweep analysis"""
-    logging.info("Starting parameter sweep analysis...")
+class EnsembleFusionSimulator(FusionPhysicsSimulator):
+    """Batched simulator advancing N plasma configurations per tick
+    
+    plasma_state and harmonic_state hold length-N arrays in their fields, and
+    every update_simulation call advances all members with array operations:
+    density modulation, tabulated reactivity and enhancement factor.
+    Telemetry stores one length-N row per tick and key. Comprehensive reports
+    pool every member's telemetry, except resonance_analysis, whose fields
+    hold one entry per member.
+    """
+    
+    def __init__(self, temperatures, magnetic_fields, harmonic_amplitudes,
+                 constants: PhysicsConstants = None,
+                 reactivity_table: Optional[ReactivityTable] = None, verbose: bool = True,
+                 telemetry_dtype=np.float64):
+        super().__init__(constants, reactivity_table=reactivity_table, verbose=verbose)
+        
+        temperatures, magnetic_fields, harmonic_amplitudes = (
+            np.array(a, dtype=float) for a in np.broadcast_arrays(
+                np.asarray(temperatures, dtype=float),
+                np.asarray(magnetic_fields, dtype=float),
+                np.asarray(harmonic_amplitudes, dtype=float)
+            )
+        )
+        self.size = temperatures.size
+        
+        self.plasma_state = PlasmaState(
+            temperature_keV=temperatures,
+            density_m3=np.full(self.size, 1e20),
+            magnetic_field_T=magnetic_fields,
+            pressure_Pa=np.zeros(self.size),
+            beta=np.zeros(self.size),
+            confinement_time_s=np.zeros(self.size)
+        )
+        
+        self.harmonic_state = HarmonicState(
+            psi_amplitude=harmonic_amplitudes,
+            phi_amplitude=harmonic_amplitudes * 0.8,
+            base_amplitude=harmonic_amplitudes * 0.6,
+            coherence_factor=np.full(self.size, 0.85),
+            resonance_match=np.full(self.size, 0.75)
+        )
+        
+        # One length-N row per tick and column; reports fall back to batch statistics
+        self.telemetry = TelemetryStore(TELEMETRY_COLUMNS, dtype=telemetry_dtype, capacity=64, width=self.size)
+        self.statistics = None
+        
+        # Without a table every member would fall back to its own quad call
+        if self.reactivity_table is None:
+            self.enable_reactivity_table()
+        
+        if verbose:
+            logging.info(f"Ensemble mode: {self.size} configurations per tick")
+    
+    def calculate_reactivity(self, temp_keV, harmonic: Optional[HarmonicState] = None) -> np.ndarray:
+        """Per-member <σv> in m³/s"""
+        return self.calculate_reactivity_batch(temp_keV, harmonic)
+    
+    def _resonance_key(self) -> Tuple:
+        """Per-member (ψ amplitude, φ amplitude, coherence) tuples and the constants"""
+        members = zip(*(np.broadcast_to(values, (self.size,)).tolist() for values in (
+            self.harmonic_state.psi_amplitude, self.harmonic_state.phi_amplitude,
+            self.harmonic_state.coherence_factor)))
+        return (tuple(members), self.constants.PSI_0, self.constants.PHI)
     
-    sim = FusionPhysicsSimulator()
+    @property
+    def resonance_peaks(self) -> List[List[Dict]]:
+        """Resonance peaks of every member, detected once per distinct member harmonic state
+        
+        Only the ψ and φ amplitudes and the coherence factor enter the
+        cross-section, so members sharing them share one peak list.
+        """
+        key = self._resonance_key()
+        if key != self._resonance_cache_key:
+            peaks_by_state = {}
+            for psi_amp, phi_amp, coherence in key[0]:
+                if (psi_amp, phi_amp, coherence) not in peaks_by_state:
+                    harmonic = HarmonicState(psi_amplitude=psi_amp, phi_amplitude=phi_amp, base_amplitude=0.0,
+                                             coherence_factor=coherence, resonance_match=0.0)
+                    peaks_by_state[psi_amp, phi_amp, coherence] = self.detect_resonance_peaks(harmonic=harmonic)
+            self._resonance_cache = [peaks_by_state[state] for state in key[0]]
+            self._resonance_cache_key = key
+        return self._resonance_cache
+    
+    def _resonance_analysis(self) -> Dict:
+        """Resonance summary with one list entry per member for every field"""
+        summaries = [self._summarize_peaks(peaks) for peaks in self.resonance_peaks]
+        return {key: [summary[key] for summary in summaries] for key in summaries[0]}
+    
+    def _compute_comprehensive_report(self) -> Dict:
+        """Comprehensive report over all members' telemetry, with per-member resonance analysis"""
+        report = super()._compute_comprehensive_report()
+        report['ensemble_members'] = self.size
+        return report
+    
+    def update_simulation(self, temp_keV=None, B_field=None, harmonic_amp=None) -> Dict:
+        """Advance every ensemble member by one timestep"""
+        profiler = self.profiler
+        mark = profiler.start()
+        
+        # Update parameters if provided (scalars broadcast to all members)
+        if temp_keV is not None:
+            self.plasma_state.temperature_keV = np.broadcast_to(temp_keV, (self.size,)).astype(float)
+        if B_field is not None:
+            self.plasma_state.magnetic_field_T = np.broadcast_to(B_field, (self.size,)).astype(float)
+        if harmonic_amp is not None:
+            harmonic_amp = np.broadcast_to(harmonic_amp, (self.size,)).astype(float)
+            self.harmonic_state.psi_amplitude = harmonic_amp
+            self.harmonic_state.phi_amplitude = harmonic_amp * 0.8
+            self.harmonic_state.base_amplitude = harmonic_amp * 0.6
+        
+        # Calculate plasma state (element-wise over all members)
+        self.plasma_state = self.calculate_plasma_parameters(
+            self.plasma_state.temperature_keV,
+            self.plasma_state.magnetic_field_T,
+            self.harmonic_state.psi_amplitude
+        )
+        mark = profiler.lap('plasma_parameters', mark)
+
+        # Calculate fusion metrics
+        reaction_rate, power_output = self.calculate_fusion_rate(self.plasma_state, self.harmonic_state)
+        mark = profiler.lap('fusion_rate', mark)
+        
+        # Calculate enhancement factor
+        classical_cs, enhanced_cs = self.calculate_dt_cross_section_batch(self.plasma_state.temperature_keV * 1000)
+        enhancement_factor = enhanced_cs / np.maximum(classical_cs, 1e-50)
+        mark = profiler.lap('cross_section', mark)
+        
+        # Calculate harmonic coherence
+        harmonic_coherence = (self.harmonic_state.psi_amplitude + 
+                            self.harmonic_state.phi_amplitude + 
+                            self.harmonic_state.base_amplitude) / 3 * self.harmonic_state.coherence_factor
+        
+        telemetry_data = {
+            'time': np.full(self.size, self.time),
+            'fusion_rate': reaction_rate,
+            'power_output': power_output,
+            'cross_section': enhanced_cs,
+            'plasma_temp': self.plasma_state.temperature_keV,
+            'plasma_density': self.plasma_state.density_m3,
+            'magnetic_field': self.plasma_state.magnetic_field_T,
+            'plasma_beta': self.plasma_state.beta,
+            'confinement_time': self.plasma_state.confinement_time_s,
+            'harmonic_coherence': harmonic_coherence,
+            'enhancement_factor': enhancement_factor
+        }
+        
+        self.telemetry.append(telemetry_data)
+        
+        # Log significant events once per tick, not once per member
+        max_enhancement = float(np.max(enhancement_factor))
+        if max_enhancement > 10:
+            self.events.record('high_enhancement', self.time, max_enhancement)
+        
+        max_beta = float(np.max(self.plasma_state.beta))
+        if max_beta > 0.1:
+            self.events.record('high_beta', self.time, max_beta)
+        self.events.end_tick()
+        
+        profiler.lap('telemetry', mark)
+        profiler.end_tick()
+        
+        self.time += self.dt
+        
+        return telemetry_data
+    
+    def member_history(self, key: str) -> np.ndarray:
+        """Telemetry for one key as a (ticks, members) array"""
+        return self.telemetry[key]
+
+# Checkpoint used by the command-line sweep, so a killed run resumes where it stopped
+SWEEP_CHECKPOINT = 'parameter_sweep_checkpoint.jsonl'
+
+# Reactivity table shared by every sweep point in a worker process
+_sweep_reactivity_table: Optional[ReactivityTable] = None
+
+def _init_sweep_worker(reactivity_table: Optional[ReactivityTable]):
+    """Process-pool initializer: install the reactivity table shared by all points"""
+    global _sweep_reactivity_table
+    _sweep_reactivity_table = reactivity_table
+
+def parameter_sweep_grid(temperatures, magnetic_fields, harmonic_amplitudes) -> List[Tuple[float, float, float]]:
+    """Sweep grid points in canonical (temperature, B-field, amplitude) order"""
+    return [(temp, B_field, harm_amp)
+            for temp in temperatures
+            for B_field in magnetic_fields
+            for harm_amp in harmonic_amplitudes]
+
+def simulate_sweep_point(point: Tuple[float, float, float], steps: int = 50,
+                         reactivity_table: Optional[ReactivityTable] = None) -> Dict:
+    """Run one grid point on its own simulator and return its averaged results row
+    
+    Without a `reactivity_table`, uses the one _init_sweep_worker installed in
+    this worker process.
+    """
+    temp, B_field, harm_amp = point
+    if reactivity_table is None:
+        reactivity_table = _sweep_reactivity_table
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False)
+    
+    # Run short simulation
+    for _ in range(steps):
+        sim.update_simulation(temp, B_field, harm_amp)
+    
+    # Calculate average performance
+    return {
+        'temperature_keV': temp,
+        'magnetic_field_T': B_field,
+        'harmonic_amplitude': harm_amp,
+        'enhancement_factor': np.mean(sim.telemetry['enhancement_factor']),
+        'power_output_MW': np.mean(sim.telemetry['power_output']),
+        'plasma_beta': np.mean(sim.telemetry['plasma_beta'])
+    }
+
+def _simulate_sweep_chunk(points: List[Tuple[float, float, float]], steps: int) -> List[Dict]:
+    """Worker task: results rows for a run of consecutive grid points"""
+    return [simulate_sweep_point(point, steps) for point in points]
+
+def sweep_fingerprint(reactivity_table: ReactivityTable) -> str:
+    """Cache key over everything a sweep row depends on besides its point and steps"""
+    return cache_key('parameter_sweep', PhysicsConstants(), reactivity_table.temperatures,
+                     reactivity_table.basis_rates)
+
+def _default_sweep_axes(temperatures=None, magnetic_fields=None, harmonic_amplitudes=None):
+    """Fill in the standard 20x11x10 sweep axes where none are given"""
+    if temperatures is None:
+        temperatures = np.linspace(1, 20, 20)  # keV
+    if magnetic_fields is None:
+        magnetic_fields = np.linspace(5, 15, 11)  # Tesla
+    if harmonic_amplitudes is None:
+        harmonic_amplitudes = np.linspace(0.1, 1.0, 10)
+    return temperatures, magnetic_fields, harmonic_amplitudes
+
+class SweepCheckpoint:
+    """Append-only JSON Lines record of completed sweep grid points
+    
+    The first line is a header holding the steps per point, the grid and the
+    sweep_fingerprint (reactivity table and physics constants); every
+    following line is one results row, flushed as soon as its point
+    completes, so a killed sweep loses at most the points still in flight.
+    Reopening the file loads every completed row (dropping a final line cut
+    off mid-write) and appends after it, after checking the header: steps and
+    fingerprint must match, and the grid may only have been extended. Rows are
+    keyed by their (temperature, B-field, amplitude) point, so a sweep over an
+    extended grid finds the old points already done.
+    """
+    
+    VERSION = 2
+    
+    def __init__(self, filename: str, steps: int, grid: List[Tuple[float, float, float]] = (),
+                 fingerprint: Optional[str] = None):
+        self.filename = filename
+        self.steps = steps
+        self.grid = [self.key(point) for point in grid]
+        self.fingerprint = fingerprint
+        self.completed: Dict[Tuple[float, float, float], Dict] = {}
+        
+        valid_bytes = 0
+        if os.path.exists(filename):
+            valid_bytes = self._load()
+        
+        self._file = open(filename, 'ab')
+        self._file.truncate(valid_bytes)
+        if valid_bytes == 0:
+            self._write({'sweep_checkpoint': self.VERSION, 'steps': steps, 'fingerprint': fingerprint,
+                         'grid': self.grid})
+    
+    @staticmethod
+    def key(row_or_point) -> Tuple[float, float, float]:
+        if isinstance(row_or_point, dict):
+            row_or_point = (row_or_point['temperature_keV'], row_or_point['magnetic_field_T'],
+                            row_or_point['harmonic_amplitude'])
+        return tuple(float(value) for value in row_or_point)
+    
+    def _load(self) -> int:
+        """Read completed rows; returns the byte length of the intact lines"""
+        with open(self.filename, 'rb') as f:
+            content = f.read()
+        
+        valid_bytes = content.rfind(b'\n') + 1
+        lines = content[:valid_bytes].splitlines()
+        if not lines:
+            return 0
+        
+        header = json.loads(lines[0])
+        if header.get('sweep_checkpoint') != self.VERSION or header.get('steps') != self.steps:
+            raise ValueError(f"Checkpoint {self.filename} was written by a different sweep "
+                             f"(version {header.get('sweep_checkpoint')}, steps={header.get('steps')}); "
+                             f"expected steps={self.steps}")
+        if header.get('fingerprint') != self.fingerprint:
+            raise ValueError(f"Checkpoint {self.filename} was written with a different reactivity table "
+                             f"or physics constants")
+        grid = set(self.grid)
+        missing = [point for point in map(self.key, header.get('grid', [])) if point not in grid]
+        if missing:
+            raise ValueError(f"Checkpoint {self.filename} covers {len(missing)} grid points outside this sweep "
+                             f"(e.g. {missing[0]}); a resumed sweep may only extend its grid")
+        
+        for line in lines[1:]:
+            row = json.loads(line)
+            self.completed[self.key(row)] = row
+        return valid_bytes
+    
+    def _write(self, record: Dict):
+        self._file.write(json.dumps(record).encode() + b'\n')
+        self._file.flush()
+    
+    def record(self, row: Dict):
+        self.completed[self.key(row)] = row
+        self._write(row)
+    
+    def sync(self):
+        """Force written rows to disk (survives a machine crash, not just a killed process)"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def close(self):
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+    
+    def __enter__(self) -> 'SweepCheckpoint':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+def run_parameter_sweep(temperatures=None, magnetic_fields=None, harmonic_amplitudes=None,
+                        steps: int = 50, workers: Optional[int] = None,
+                        chunksize: Optional[int] = None, save: bool = True,
+                        checkpoint: Optional[str] = None,
+                        reactivity_table: Optional[ReactivityTable] = None) -> 'pandas.DataFrame':
+    """Run parameter sweep analysis
+    
+    Grid points are distributed over a ProcessPoolExecutor (`workers` processes,
+    defaulting to the CPU count; workers=1 runs in-process) in chunks of
+    `chunksize` consecutive points. Each point gets a fresh simulator, and
+    results come back in grid order regardless of which worker finished first.
+    
+    With a `checkpoint` filename, every chunk's rows are appended to that
+    SweepCheckpoint as soon as the chunk completes, and points already
+    recorded there are skipped: rerunning after an interruption resumes where
+    it stopped, and rerunning with extra axis values computes only the new
+    points.
+    
+    Every point shares one `reactivity_table`; pass a prebuilt one to reuse it
+    across sweeps (building it takes longer than a small sweep). A checkpoint
+    only resumes with the same table, so one is built up front when needed.
+    """
+    import pandas as pd
+    
+    logging.info("Starting parameter sweep analysis...")
     
     # Parameter ranges
-    temperatures = np.linspace(1, 20, 20)  # keV
-    magnetic_fields = np.linspace(5, 15, 11)  # Tesla
-    harmonic_amplitudes = np.linspace(0.1, 1.0, 10)
-    
-    results = []
-    
-    for temp in temperatures:
-        for B_field in magnetic_fields:
-            for harm_amp in harmonic_amplitudes:
-                # Reset simulation
-                sim.time = 0
-                sim.telemetry = {key: [] for key in sim.telemetry.keys()}
-                
-                # Run short simulation
-                for _ in range(50):  # 0.5 seconds
-                    data = sim.update_simulation(temp, B_field, harm_amp)
-                
-                # Calculate average performance
-                avg_enhancement = np.mean(sim.telemetry['enhancement_factor'])
-                avg_power = np.mean(sim.telemetry['power_output'])
-                
-                results.append({
-                    'temperature_keV': temp,
-                    'magnetic_field_T': B_field,
-                    'harmonic_amplitude': harm_amp,
-                    'enhancement_factor': avg_enhancement,
-                    'power_output_MW': avg_power,
-                    'plasma_beta': np.mean(sim.telemetry['plasma_beta'])
-                })
-    
-    # Save results
-    df = pd.DataFrame(results)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"parameter_sweep_{timestamp}.csv"
-    df.to_csv(filename, index=False)
-    
-    logging.info(f"Parameter sweep completed. Results saved to {filename}")
+    temperatures, magnetic_fields, harmonic_amplitudes = _default_sweep_axes(
+        temperatures, magnetic_fields, harmonic_amplitudes
+    )
+    
+    grid = parameter_sweep_grid(temperatures, magnetic_fields, harmonic_amplitudes)
+    
+    sweep_checkpoint = None
+    if checkpoint is not None:
+        if reactivity_table is None:
+            reactivity_table = FusionPhysicsSimulator().enable_reactivity_table()
+        sweep_checkpoint = SweepCheckpoint(checkpoint, steps, grid, sweep_fingerprint(reactivity_table))
+    completed = sweep_checkpoint.completed if sweep_checkpoint is not None else {}
+    pending = [point for point in grid if SweepCheckpoint.key(point) not in completed]
+    if completed:
+        logging.info(f"Resuming from {checkpoint}: {len(grid) - len(pending)}/{len(grid)} points already done")
+    
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(pending) // (workers * 8))
+    
+    results = {}
+    progress_every = max(1, len(pending) // 20)
+    
+    def record(row):
+        results[SweepCheckpoint.key(row)] = row
+        done = len(results)
+        if sweep_checkpoint is not None:
+            sweep_checkpoint.record(row)
+        if done % progress_every == 0 or done == len(pending):
+            if sweep_checkpoint is not None:
+                sweep_checkpoint.sync()
+            elapsed = time.perf_counter() - start
+            logging.info(f"Sweep progress: {done}/{len(pending)} points ({100 * done / len(pending):.0f}%), "
+                         f"{done / elapsed:.1f} points/s, {done * steps / elapsed:.0f} ticks/s")
+    
+    try:
+        if pending:
+            # Build the reactivity table once and ship it to every worker
+            if reactivity_table is None:
+                reactivity_table = FusionPhysicsSimulator().enable_reactivity_table()
+            logging.info(f"Sweeping {len(pending)} grid points x {steps} steps on {workers} worker(s), "
+                         f"chunksize {chunksize}")
+            start = time.perf_counter()
+            
+            if workers == 1:
+                for point in pending:
+                    record(simulate_sweep_point(point, steps, reactivity_table))
+            else:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker,
+                                         initargs=(reactivity_table,)) as executor:
+                    futures = [executor.submit(_simulate_sweep_chunk, pending[i:i + chunksize], steps)
+                               for i in range(0, len(pending), chunksize)]
+                    try:
+                        # Record chunks in completion order, so a slow chunk never holds
+                        # finished ones back from the checkpoint; rows are reordered below
+                        for future in as_completed(futures):
+                            for row in future.result():
+                                record(row)
+                    except BaseException:
+                        for future in futures:
+                            future.cancel()
+                        raise
+    finally:
+        if sweep_checkpoint is not None:
+            sweep_checkpoint.close()
+    
+    # Rows in grid order, whether computed now or read back from the checkpoint
+    rows = [results.get(key) or completed[key] for key in map(SweepCheckpoint.key, grid)]
+    return _finish_parameter_sweep(pd.DataFrame(rows), save)
+
+# Objectives for run_parameter_optimization, each maximized over a sweep results row
+SWEEP_OBJECTIVES = ('enhancement', 'power', 'beta_constrained_power')
+
+class _EvaluationBudgetExhausted(Exception):
+    pass
+
+def _sweep_objective(objective, beta_limit: float):
+    """Callable scoring one sweep results row (higher is better), and its name"""
+    if callable(objective):
+        return objective, getattr(objective, '__name__', 'custom')
+    if objective == 'enhancement':
+        return (lambda row: row['enhancement_factor']), objective
+    if objective == 'power':
+        return (lambda row: row['power_output_MW']), objective
+    if objective == 'beta_constrained_power':
+        # Power is never negative, so any point within the beta limit beats any
+        # point beyond it, and beyond it the score still points back inside
+        def score(row):
+            if row['plasma_beta'] <= beta_limit:
+                return row['power_output_MW']
+            return beta_limit - row['plasma_beta']
+        return score, objective
+    raise ValueError(f"Unknown objective '{objective}', expected one of {SWEEP_OBJECTIVES} or a callable")
+
+def run_parameter_optimization(bounds=None, objective='enhancement', steps: int = 50,
+                               max_evaluations: int = 150, coarse_points: int = 3,
+                               beta_limit: float = 0.1, xatol: float = 1e-3,
+                               reactivity_table: Optional[ReactivityTable] = None) -> Dict:
+    """Search temperature, B-field and harmonic amplitude for the best sweep point
+    
+    A coarse-to-fine alternative to run_parameter_sweep. Each evaluation is one
+    simulate_sweep_point run (`steps` ticks, scored on its averaged results row),
+    and at most `max_evaluations` are spent. A coarse_points³ grid over `bounds`
+    (default: the sweep's axis ranges) picks the starting point; bounded
+    Nelder-Mead then refines it in coordinates scaled to each axis range,
+    converging once the simplex is smaller than `xatol` of every range.
+    
+    `objective` is a name from SWEEP_OBJECTIVES or a callable taking a results
+    row and returning the value to maximize; 'beta_constrained_power' maximizes
+    power among points with average beta <= `beta_limit`. The default budget is
+    150 x 50 = 7,500 ticks, against 110,000 for the default grid sweep.
+    As in run_parameter_sweep, a prebuilt `reactivity_table` can be passed in.
+    """
+    from scipy import optimize
+    
+    score, objective_name = _sweep_objective(objective, beta_limit)
+    
+    if bounds is None:
+        bounds = [(min(axis), max(axis)) for axis in _default_sweep_axes()]
+    bounds = np.array(bounds, dtype=float)
+    low, span = bounds[:, 0], bounds[:, 1] - bounds[:, 0]
+    
+    logging.info(f"Starting parameter optimization: objective {objective_name}, "
+                 f"budget {max_evaluations} evaluations x {steps} steps")
+    if reactivity_table is None:
+        reactivity_table = FusionPhysicsSimulator().enable_reactivity_table()
+    
+    evaluations: List[Tuple[Tuple[float, float, float], Dict, float]] = []
+    
+    def evaluate(unit) -> float:
+        if len(evaluations) >= max_evaluations:
+            raise _EvaluationBudgetExhausted
+        point = tuple(float(x) for x in low + span * np.clip(unit, 0.0, 1.0))
+        row = simulate_sweep_point(point, steps, reactivity_table)
+        value = float(score(row))
+        evaluations.append((point, row, value))
+        return value
+    
+    def best():
+        return max(evaluations, key=lambda evaluation: evaluation[2])
+    
+    start = time.perf_counter()
+    converged = False
+    try:
+        # Coarse stage: a small grid, corners included
+        axis = np.linspace(0.0, 1.0, coarse_points)
+        for unit in parameter_sweep_grid(axis, axis, axis):
+            evaluate(np.array(unit))
+        
+        # Fine stage: Nelder-Mead from the best coarse point, initial simplex
+        # spanning half a coarse cell along each axis (mirrored at the bounds)
+        origin = (np.array(best()[0]) - low) / span
+        cell = 0.5 / max(coarse_points - 1, 1)
+        simplex = [origin]
+        for i in range(3):
+            vertex = origin.copy()
+            vertex[i] += cell if origin[i] + cell <= 1.0 else -cell
+            simplex.append(vertex)
+        
+        result = optimize.minimize(lambda unit: -evaluate(unit), origin, method='Nelder-Mead',
+                                   bounds=[(0.0, 1.0)] * 3,
+                                   options={'initial_simplex': np.array(simplex), 'xatol': xatol,
+                                            'fatol': np.inf, 'maxfev': max_evaluations})
+        converged = bool(result.success)
+    except _EvaluationBudgetExhausted:
+        logging.info(f"Optimization stopped at its budget of {max_evaluations} evaluations")
+    
+    elapsed = time.perf_counter() - start
+    point, row, value = best()
+    
+    logging.info(f"Optimization: {len(evaluations)} evaluations ({len(evaluations) * steps} ticks) "
+                 f"in {elapsed:.2f}s, converged: {converged}")
+    logging.info("Optimal parameters found:")
+    logging.info(f"Temperature: {point[0]:.3f} keV")
+    logging.info(f"Magnetic Field: {point[1]:.3f} T")
+    logging.info(f"Harmonic Amplitude: {point[2]:.4f}")
+    logging.info(f"Objective ({objective_name}): {value:.6g}")
+    
+    return {
+        'optimal_parameters': {'temperature_keV': point[0], 'magnetic_field_T': point[1],
+                               'harmonic_amplitude': point[2]},
+        'objective': objective_name,
+        'objective_value': value,
+        'results': row,
+        'bounds': bounds.tolist(),
+        'at_bound': [bool(np.isclose(x, b[0]) or np.isclose(x, b[1])) for x, b in zip(point, bounds)],
+        'evaluations': len(evaluations),
+        'ticks': len(evaluations) * steps,
+        'converged': converged
+    }
+
+def run_ensemble_sweep(temperatures=None, magnetic_fields=None, harmonic_amplitudes=None,
+                       steps: int = 50, save: bool = True,
+                       reactivity_table: Optional[ReactivityTable] = None) -> 'pandas.DataFrame':
+    """Parameter sweep evaluated as one ensemble: `steps` array ticks for the whole grid
+    
+    Produces the same DataFrame/CSV schema and row order as run_parameter_sweep,
+    and likewise accepts a prebuilt `reactivity_table`.
+    """
+    import pandas as pd
+    
+    logging.info("Starting ensemble parameter sweep...")
+    
+    temperatures, magnetic_fields, harmonic_amplitudes = _default_sweep_axes(
+        temperatures, magnetic_fields, harmonic_amplitudes
+    )
+    grid = np.array(parameter_sweep_grid(temperatures, magnetic_fields, harmonic_amplitudes), dtype=float)
+    
+    sim = EnsembleFusionSimulator(grid[:, 0], grid[:, 1], grid[:, 2], reactivity_table=reactivity_table)
+    
+    start = time.perf_counter()
+    for _ in range(steps):
+        sim.update_simulation()
+    elapsed = time.perf_counter() - start
+    logging.info(f"Ensemble sweep: {len(grid)} members x {steps} steps in {elapsed:.2f}s "
+                 f"({len(grid) * steps / elapsed:.0f} member-ticks/s)")
+    
+    df = pd.DataFrame({
+        'temperature_keV': grid[:, 0],
+        'magnetic_field_T': grid[:, 1],
+        'harmonic_amplitude': grid[:, 2],
+        'enhancement_factor': sim.member_history('enhancement_factor').mean(axis=0),
+        'power_output_MW': sim.member_history('power_output').mean(axis=0),
+        'plasma_beta': sim.member_history('plasma_beta').mean(axis=0)
+    })
+    
+    return _finish_parameter_sweep(df, save)
+
+def _finish_parameter_sweep(df: 'pandas.DataFrame', save: bool) -> 'pandas.DataFrame':
+    """Save sweep results and log the optimal grid point"""
+    if save:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"parameter_sweep_{timestamp}.csv"
+        df.to_csv(filename, index=False)
+        logging.info(f"Parameter sweep completed. Results saved to {filename}")
     
     # Find optimal parameters
     optimal_idx = df['enhancement_factor'].idxmax()
@@ -497,37 +1394,105 @@ def run_parameter_sweep():
     
     return df
 
-def run_realtime_simulation(duration_seconds: int = 10):
-    """Run real-time simulation with telemetry logging"""
-    logging.info(f"Starting real-time simulation for {duration_seconds} seconds...")
-    
-    sim = FusionPhysicsSimulator()
-    
+def set_realtime_operating_point(sim: FusionPhysicsSimulator):
+    """Start `sim` from the real-time demonstration parameters"""
     # Optimal parameters from analysis
     sim.plasma_state.temperature_keV = 15.0
     sim.plasma_state.magnetic_field_T = 12.0
     sim.harmonic_state.psi_amplitude = 0.8
     sim.harmonic_state.phi_amplitude = 0.7
     sim.harmonic_state.base_amplitude = 0.6
-    
-    # Run simulation
-    steps = int(duration_seconds / sim.dt)
-    
-    for step in range(steps):
+
+def realtime_scenario(sim: FusionPhysicsSimulator):
+    """Per-step update_simulation arguments for the real-time demonstration run"""
+    def parameters(step: int) -> Dict:
         # Add some realistic parameter variations
         temp_variation = 0.5 * np.sin(2 * np.pi * step * sim.dt / 2.0)  # 2-second period
         B_variation = 0.2 * np.sin(2 * np.pi * step * sim.dt / 5.0)    # 5-second period
         
-        current_temp = sim.plasma_state.temperature_keV + temp_variation
-        current_B = sim.plasma_state.magnetic_field_T + B_variation
-        
-        data = sim.update_simulation(current_temp, current_B)
-        
+        return {'temp_keV': sim.plasma_state.temperature_keV + temp_variation,
+                'B_field': sim.plasma_state.magnetic_field_T + B_variation}
+    
+    return parameters
+
+def realtime_trajectory(sim: FusionPhysicsSimulator, duration_seconds: float) -> Dict[str, np.ndarray]:
+    """Telemetry of run_realtime_simulation's scenario in closed form, via simulate_trajectory
+    
+    realtime_scenario adds each step's variation to the previous setpoint, so
+    the schedules are cumulative sums of the sinusoids.
+    """
+    steps = np.arange(int(duration_seconds / sim.dt))
+    times = steps * sim.dt
+    temperature = sim.plasma_state.temperature_keV + np.cumsum(0.5 * np.sin(2 * np.pi * times / 2.0))
+    magnetic_field = sim.plasma_state.magnetic_field_T + np.cumsum(0.2 * np.sin(2 * np.pi * times / 5.0))
+    return sim.simulate_trajectory(sim.time + times, temperature, magnetic_field)
+
+async def _run_paced(sim: FusionPhysicsSimulator, steps: int, parameters, log_progress) -> Dict:
+    """Drive `steps` wall-clock paced ticks, logging from an async telemetry subscriber"""
+    import asyncio
+    from fusion_realtime import RealtimeDriver
+    
+    driver = RealtimeDriver(sim, schedule=parameters)
+    subscription = driver.subscribe(policy='block')
+    
+    async def consume():
+        step = 0
+        async for data in subscription:
+            log_progress(step, data)
+            step += 1
+    
+    consumer = asyncio.ensure_future(consume())
+    metrics = await driver.run(steps=steps)
+    await consumer
+    return metrics
+
+def run_realtime_simulation(duration_seconds: int = 10, telemetry_capacity: Optional[int] = None,
+                            telemetry_format: str = 'json', stream_filename: Optional[str] = None,
+                            realtime: bool = False):
+    """Run real-time simulation with telemetry logging
+    
+    telemetry_capacity bounds memory by keeping only the latest records in a ring buffer;
+    telemetry_format selects the saved file format ('json', 'npz' or 'parquet').
+    stream_filename additionally appends every tick to a JSON Lines file as the run
+    progresses, so a crash keeps everything up to the last flush.
+    With realtime=True the ticks are paced to wall-clock time at 1/dt by a
+    fusion_realtime.RealtimeDriver, and its jitter and overrun metrics are added
+    to the report under 'realtime'; otherwise the loop runs as fast as it can.
+    """
+    logging.info(f"Starting real-time simulation for {duration_seconds} seconds...")
+    
+    sim = FusionPhysicsSimulator(telemetry_capacity=telemetry_capacity)
+    sim.enable_reactivity_table()
+    
+    set_realtime_operating_point(sim)
+    
+    # Run simulation
+    steps = int(duration_seconds / sim.dt)
+    log_every = int(1.0 / sim.dt)
+    
+    parameters = realtime_scenario(sim)
+    
+    def log_progress(step: int, data: Dict):
         # Log every second
-        if step % int(1.0 / sim.dt) == 0:
-            logging.info(f"t={sim.time:.1f}s: Enhancement={data['enhancement_factor']:.1f}x, "
+        if step % log_every == 0:
+            logging.info(f"t={data['time'] + sim.dt:.1f}s: Enhancement={data['enhancement_factor']:.1f}x, "
                         f"Power={data['power_output']:.2f}MW, Beta={data['plasma_beta']:.3f}")
     
+    if stream_filename is not None:
+        sim.attach_telemetry_stream(stream_filename)
+    
+    realtime_metrics = None
+    try:
+        if realtime:
+            import asyncio
+            realtime_metrics = asyncio.run(_run_paced(sim, steps, parameters, log_progress))
+        else:
+            for step in range(steps):
+                log_progress(step, sim.update_simulation(**parameters(step)))
+    finally:
+        sim.detach_telemetry_stream()
+        sim.events.flush()
+    
     # Generate final report
     report = sim.generate_comprehensive_report()
     logging.info("Simulation completed. Final report:")
@@ -535,13 +1500,16 @@ def run_realtime_simulation(duration_seconds: int = 10):
     logging.info(f"Maximum enhancement: {report['performance_metrics']['maximum_enhancement_factor']:.1f}x")
     logging.info(f"Average power: {report['performance_metrics']['average_power_output_MW']:.2f} MW")
     logging.info(f"Resonance peaks detected: {report['resonance_analysis']['peak_count']}")
+    if realtime_metrics is not None:
+        report['realtime'] = realtime_metrics
     
-    # Save telemetry
-    filename = sim.save_telemetry()
+    # Save telemetry, with the realtime metrics in the stored report
+    filename = sim.save_telemetry(format=telemetry_format, report=report)
     
     return sim, report, filename
 
 if __name__ == "__main__":
+    configure_logging()
     logging.info("Harmonic Fusion Physics Simulation Starting...")
     logging.info("Mathematical constants:")
     logging.info(f"ψ₀ = {PhysicsConstants.PSI_0}")
@@ -550,7 +1518,7 @@ if __name__ == "__main__":
     
     # Run comprehensive analysis
     print("\n1. Running parameter sweep analysis...")
-    sweep_results = run_parameter_sweep()
+    sweep_results = run_parameter_sweep(checkpoint=SWEEP_CHECKPOINT)
     
     print("\n2. Running real-time simulation...")
     simulator, final_report, telemetry_file = run_realtime_simulation(duration_seconds=30)
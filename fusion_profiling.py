@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Harmonic Fusion Stage Profiling
+Opt-in per-stage timing and work counters for the fusion simulators
+
+A simulator always holds a profiler. By default it is NULL_PROFILER, whose
+methods do nothing and never read the clock, so the instrumentation left in
+update_simulation costs a few no-op method calls per tick. enable_profiling()
+swaps in a StageProfiler that records every stage's wall time and every
+counter's per-tick total into fixed-size log-spaced histograms.
+measure_allocations() reports what a tick allocates, for GC-pressure work.
+"""
+
+import bisect
+import gc
+import time
+import tracemalloc
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence
+
+from fusion_telemetry import RunningStatistics
+
+# Temperature bin edges (keV) for attributing stage times by plasma temperature
+DEFAULT_TEMPERATURE_BINS = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0)
+
+class LogHistogram:
+    """Histogram with log-spaced bins between `low` and `high`, plus exact moments
+
+    Values below `low` (including zero) land in an underflow bin and values
+    above `high` in an overflow bin. Memory is fixed regardless of how many
+    values are added; quantiles are estimated at the geometric bin centre and
+    clamped to the exact min/max.
+    """
+
+    __slots__ = ('edges', 'counts', 'stats')
+
+    def __init__(self, low: float, high: float, bins_per_decade: int = 10):
+        bins = max(1, int(round(np.log10(high / low) * bins_per_decade)))
+        self.edges = np.geomspace(low, high, bins + 1).tolist()
+        self.counts = [0] * (bins + 2)  # [underflow, bins..., overflow]
+        self.stats = RunningStatistics()
+
+    def add(self, value: float):
+        self.counts[bisect.bisect_right(self.edges, value)] += 1
+        self.stats.update(value)
+
+    @property
+    def total(self) -> float:
+        return self.stats.mean * self.stats.count
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile (0 <= q <= 1) from the bin counts"""
+        if not self.stats.count:
+            return np.nan
+        cumulative = np.cumsum(self.counts)
+        index = int(np.searchsorted(cumulative, q * self.stats.count, side='left'))
+        if index == 0:
+            estimate = self.stats.min
+        elif index == len(self.counts) - 1:
+            estimate = self.stats.max
+        else:
+            estimate = np.sqrt(self.edges[index - 1] * self.edges[index])
+        return float(np.clip(estimate, self.stats.min, self.stats.max))
+
+    def summary(self) -> Dict[str, float]:
+        summary = self.stats.summary()
+        summary.update(total=self.total, p50=self.quantile(0.5),
+                       p90=self.quantile(0.9), p99=self.quantile(0.99))
+        return summary
+
+    def to_dict(self) -> Dict[str, List]:
+        """Bin edges and counts; counts[0] is the underflow and counts[-1] the overflow bin"""
+        return {'edges': list(self.edges), 'counts': list(self.counts)}
+
+class NullProfiler:
+    """Profiler stand-in that records nothing"""
+
+    enabled = False
+
+    def start(self) -> float:
+        return 0.0
+
+    def lap(self, stage: str, start: float) -> float:
+        return 0.0
+
+    def count(self, counter: str, amount: int = 1):
+        pass
+
+    def end_tick(self, temperature_keV=None):
+        pass
+
+NULL_PROFILER = NullProfiler()
+
+class StageProfiler:
+    """Per-stage wall-time and per-tick counter histograms
+
+    Inside a tick, `start()` / `lap(stage, mark)` time consecutive stages and
+    `count(counter, n)` accumulates work counters (quadrature evaluations,
+    cross-section calls...). `end_tick(temperature_keV)` files the tick: each
+    stage time and counter total goes into its histogram, the stage times add
+    up to the 'tick' histogram, and for a scalar temperature the stage times
+    are also accumulated per temperature bin so the dominant stage can be read
+    off at each temperature.
+    """
+
+    enabled = True
+
+    # Histogram ranges: 100 ns - 10 s for times, 1 - 10⁷ for counts
+    TIME_RANGE = (1e-7, 10.0)
+    COUNT_RANGE = (1.0, 1e7)
+
+    def __init__(self, temperature_bins: Optional[Sequence[float]] = DEFAULT_TEMPERATURE_BINS):
+        self.temperature_bins = None if temperature_bins is None else np.asarray(temperature_bins, dtype=float)
+        self.clear()
+
+    def clear(self):
+        self.ticks = 0
+        self.stage_times: Dict[str, LogHistogram] = {}
+        self.counters: Dict[str, LogHistogram] = {}
+        self._tick_times: Dict[str, float] = {}
+        self._tick_counts: Dict[str, int] = {}
+        bins = 0 if self.temperature_bins is None else len(self.temperature_bins) + 1
+        self._temperature_ticks = np.zeros(bins, dtype=np.int64)
+        self._temperature_times: Dict[str, np.ndarray] = {}
+
+    def start(self) -> float:
+        return time.perf_counter()
+
+    def lap(self, stage: str, start: float) -> float:
+        """Charge the time since `start` to `stage` and return the new mark"""
+        now = time.perf_counter()
+        self._tick_times[stage] = self._tick_times.get(stage, 0.0) + (now - start)
+        return now
+
+    def count(self, counter: str, amount: int = 1):
+        self._tick_counts[counter] = self._tick_counts.get(counter, 0) + amount
+
+    def end_tick(self, temperature_keV=None):
+        self.ticks += 1
+
+        tick_total = 0.0
+        for stage, seconds in self._tick_times.items():
+            self._histogram(self.stage_times, stage, self.TIME_RANGE).add(seconds)
+            tick_total += seconds
+        self._histogram(self.stage_times, 'tick', self.TIME_RANGE).add(tick_total)
+
+        # Every counter seen so far gets a sample, zero if it did not fire this tick
+        for counter in self._tick_counts:
+            self._histogram(self.counters, counter, self.COUNT_RANGE)
+        for counter, histogram in self.counters.items():
+            histogram.add(self._tick_counts.get(counter, 0))
+
+        if self.temperature_bins is not None and temperature_keV is not None and np.ndim(temperature_keV) == 0:
+            index = int(np.searchsorted(self.temperature_bins, temperature_keV, side='right'))
+            self._temperature_ticks[index] += 1
+            for stage, seconds in self._tick_times.items():
+                if stage not in self._temperature_times:
+                    self._temperature_times[stage] = np.zeros(len(self._temperature_ticks))
+                self._temperature_times[stage][index] += seconds
+
+        self._tick_times.clear()
+        self._tick_counts.clear()
+
+    @staticmethod
+    def _histogram(histograms: Dict[str, LogHistogram], name: str, value_range) -> LogHistogram:
+        if name not in histograms:
+            histograms[name] = LogHistogram(*value_range)
+        return histograms[name]
+
+    def histograms(self) -> Dict[str, Dict[str, Dict[str, List]]]:
+        """Raw bin edges and counts for every stage and counter"""
+        return {
+            'stages': {name: h.to_dict() for name, h in self.stage_times.items()},
+            'counters': {name: h.to_dict() for name, h in self.counters.items()}
+        }
+
+    def by_temperature(self) -> List[Dict]:
+        """Mean stage times per temperature bin, with the dominant stage of each bin"""
+        if self.temperature_bins is None:
+            return []
+
+        edges = np.concatenate(([0.0], self.temperature_bins, [np.inf]))
+        rows = []
+        for index, ticks in enumerate(self._temperature_ticks):
+            if not ticks:
+                continue
+            mean_times = {stage: float(times[index] / ticks)
+                          for stage, times in self._temperature_times.items()}
+            rows.append({
+                'temperature_range_keV': [float(edges[index]), float(edges[index + 1])],
+                'ticks': int(ticks),
+                'mean_stage_seconds': mean_times,
+                'dominant_stage': max(mean_times, key=mean_times.get) if mean_times else None
+            })
+        return rows
+
+    def summary(self) -> Dict:
+        """Stage time and counter statistics, time shares and temperature breakdown"""
+        tick = self.stage_times.get('tick')
+        tick_total = tick.total if tick is not None else 0.0
+
+        return {
+            'ticks': self.ticks,
+            'stage_seconds': {name: h.summary() for name, h in self.stage_times.items()},
+            'stage_share': {name: (h.total / tick_total if tick_total else np.nan)
+                            for name, h in self.stage_times.items() if name != 'tick'},
+            'counters_per_tick': {name: h.summary() for name, h in self.counters.items()},
+            'by_temperature': self.by_temperature()
+        }
+
+def measure_allocations(tick: Callable[[], object], ticks: int = 1000, warmup: int = 100,
+                        top: int = 10) -> Dict:
+    """Memory allocated by `tick()` per call, measured with tracemalloc, and GC activity
+
+    After `warmup` untraced calls (filling caches and lazily built state), one
+    untimed pass of `ticks` calls counts garbage collections per generation,
+    then a traced pass records, per call, the peak traced memory above the
+    starting level ('transient_bytes': everything the call had live at once,
+    freed or not) and, over the whole pass, the bytes and blocks still
+    allocated at the end ('retained'), with the `top` source lines retaining
+    the most.
+    """
+    for _ in range(warmup):
+        tick()
+
+    gc.collect()
+    collections = [generation['collections'] for generation in gc.get_stats()]
+    for _ in range(ticks):
+        tick()
+    collections = [generation['collections'] - before
+                   for generation, before in zip(gc.get_stats(), collections)]
+
+    transient = RunningStatistics()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(ticks):
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            tick()
+            transient.update(tracemalloc.get_traced_memory()[1] - current)
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    # Only count allocations made on behalf of the ticks, not by tracemalloc itself
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    differences = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'lineno')
+    retained_bytes = sum(d.size_diff for d in differences)
+    retained_blocks = sum(d.count_diff for d in differences)
+
+    return {
+        'ticks': ticks,
+        'transient_bytes': transient.summary(),
+        'retained_bytes_per_tick': retained_bytes / ticks,
+        'retained_blocks_per_tick': retained_blocks / ticks,
+        'gc_collections': {f'generation_{i}': count for i, count in enumerate(collections)},
+        'top_retaining_sites': [{'site': f'{d.traceback[0].filename}:{d.traceback[0].lineno}',
+                                 'bytes': d.size_diff, 'blocks': d.count_diff}
+                                for d in sorted(differences, key=lambda d: -d.size_diff)[:top]
+                                if d.size_diff > 0]
+    }
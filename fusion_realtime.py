@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Harmonic Fusion Real-Time Driver
+Wall-clock paced simulation ticks with async telemetry fan-out
+
+RealtimeDriver advances a simulator at a fixed rate (by default 1/dt, i.e.
+100 Hz) on an asyncio event loop. Tick deadlines are absolute (start + n ×
+period), so sleep inaccuracy never accumulates into drift. Each
+update_simulation call runs on a single-thread executor, keeping the event
+loop free to serve subscribers while a tick computes; every record is then
+fanned out to any number of TelemetrySubscription queues, each with its own
+size limit and backpressure policy.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from fusion_profiling import LogHistogram
+
+# Subscriber backpressure policies
+SUBSCRIBER_POLICIES = ('drop_oldest', 'drop_newest', 'block')
+
+_CLOSED = object()
+
+class TelemetrySubscription:
+    """Bounded async stream of tick records for one consumer
+
+    When the queue is full, 'drop_oldest' discards the oldest queued record
+    (consumers see the freshest data), 'drop_newest' discards the incoming
+    record, and 'block' makes the driver wait, which slows the tick loop and
+    shows up as lateness and overruns. Iterate with `async for`; iteration
+    ends when the driver finishes or the subscription is closed.
+    """
+
+    def __init__(self, maxsize: int = 256, policy: str = 'drop_oldest'):
+        if policy not in SUBSCRIBER_POLICIES:
+            raise ValueError(f"Unknown subscriber policy '{policy}', expected one of {SUBSCRIBER_POLICIES}")
+        self.policy = policy
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.delivered = 0
+        self.dropped = 0
+        self.closed = False
+
+    async def publish(self, record: Dict):
+        if self.closed:
+            return
+        if self.policy == 'block':
+            await self.queue.put(record)
+        else:
+            if self.queue.full():
+                if self.policy == 'drop_newest':
+                    self.dropped += 1
+                    return
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait(record)
+        self.delivered += 1
+
+    def close(self):
+        """End iteration once the queued records have been consumed"""
+        if not self.closed:
+            self.closed = True
+            if self.queue.full():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait(_CLOSED)
+
+    async def finish(self):
+        """End the stream after everything queued; waits for room under 'block'"""
+        if self.closed:
+            return
+        if self.policy == 'block':
+            self.closed = True
+            await self.queue.put(_CLOSED)
+        else:
+            self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict:
+        record = await self.queue.get()
+        if record is _CLOSED:
+            raise StopAsyncIteration
+        return record
+
+class RealtimeDriver:
+    """Fixed-rate asyncio driver for FusionPhysicsSimulator.update_simulation
+
+    `schedule(step)` returns the keyword arguments for each tick's
+    update_simulation call (temp_keV, B_field, harmonic_amp); None means no
+    parameter changes. When a tick finishes after the next deadline it counts
+    as an overrun and the next tick starts immediately. Deadlines more than a
+    whole period in the past are skipped (and counted) unless `catch_up` is
+    set, in which case missed ticks run back to back, at most `max_catch_up`
+    in a row, before the schedule realigns.
+    """
+
+    def __init__(self, simulator, rate_hz: Optional[float] = None,
+                 schedule: Optional[Callable[[int], Optional[Dict]]] = None,
+                 executor: Optional[Executor] = None, catch_up: bool = False, max_catch_up: int = 10):
+        self.simulator = simulator
+        self.rate_hz = rate_hz if rate_hz is not None else 1.0 / simulator.dt
+        self.period = 1.0 / self.rate_hz
+        self.schedule = schedule
+        self.executor = executor
+        self.catch_up = catch_up
+        self.max_catch_up = max_catch_up
+        self.subscribers: List[TelemetrySubscription] = []
+        self._stopping = False
+        self.reset_metrics()
+
+    def reset_metrics(self):
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.lateness = LogHistogram(1e-7, 10.0)
+        self.tick_seconds = LogHistogram(1e-7, 10.0)
+        self.elapsed = 0.0
+
+    def subscribe(self, maxsize: int = 256, policy: str = 'drop_oldest') -> TelemetrySubscription:
+        """New subscriber receiving every tick record from now on"""
+        subscription = TelemetrySubscription(maxsize, policy)
+        self.subscribers.append(subscription)
+        return subscription
+
+    def stop(self):
+        """Ask a running driver to finish after the current tick"""
+        self._stopping = True
+
+    async def _tick(self, loop, executor: Executor, step: int) -> Dict:
+        kwargs = (self.schedule(step) if self.schedule is not None else None) or {}
+        record = await loop.run_in_executor(executor, partial(self.simulator.update_simulation, **kwargs))
+        if getattr(self.simulator, 'low_allocation', False):
+            record = dict(record)  # the simulator refills this dict next tick; subscribers keep theirs
+        for subscription in self.subscribers:
+            await subscription.publish(record)
+        return record
+
+    async def run(self, duration_seconds: Optional[float] = None, steps: Optional[int] = None) -> Dict:
+        """Tick until `steps` ticks ran, `duration_seconds` elapsed, or stop() was called"""
+        if steps is None and duration_seconds is not None:
+            steps = int(round(duration_seconds * self.rate_hz))
+
+        loop = asyncio.get_running_loop()
+        executor = self.executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix='fusion-tick')
+        self._stopping = False
+
+        start = loop.time()
+        slot = 0  # index of the next deadline: start + slot * period
+        step = 0
+        behind = 0
+        try:
+            while not self._stopping and (steps is None or step < steps):
+                deadline = start + slot * self.period
+                now = loop.time()
+                if now < deadline:
+                    await asyncio.sleep(deadline - now)
+                    now = loop.time()
+
+                self.lateness.add(max(0.0, now - deadline))
+                tick_start = time.perf_counter()
+                await self._tick(loop, executor, step)
+                self.tick_seconds.add(time.perf_counter() - tick_start)
+                self.ticks += 1
+                step += 1
+                slot += 1
+
+                now = loop.time()
+                next_deadline = start + slot * self.period
+                if now > next_deadline:
+                    self.overruns += 1
+                    missed = int((now - next_deadline) // self.period)
+                    behind = behind + 1 if self.catch_up else 0
+                    if missed and (not self.catch_up or behind > self.max_catch_up):
+                        # Realign to the next future deadline instead of bursting
+                        self.skipped += missed
+                        slot += missed
+                        behind = 0
+                else:
+                    behind = 0
+        finally:
+            self.elapsed = loop.time() - start
+            for subscription in self.subscribers:
+                await subscription.finish()
+            if self.executor is None:
+                executor.shutdown(wait=True)
+
+        metrics = self.metrics()
+        logging.info(f"Real-time run: {metrics['ticks']} ticks in {metrics['elapsed_s']:.2f}s "
+                     f"({metrics['achieved_rate_hz']:.1f}/{self.rate_hz:.1f} Hz), "
+                     f"jitter p99 {metrics['lateness_s']['p99'] * 1e3:.2f} ms, "
+                     f"{metrics['overruns']} overruns, {metrics['skipped']} skipped")
+        return metrics
+
+    def metrics(self) -> Dict:
+        """Tick lateness (jitter), tick compute time, overruns and subscriber drops"""
+        return {
+            'ticks': self.ticks,
+            'target_rate_hz': self.rate_hz,
+            'achieved_rate_hz': self.ticks / self.elapsed if self.elapsed else 0.0,
+            'elapsed_s': self.elapsed,
+            'lateness_s': self.lateness.summary(),
+            'tick_seconds': self.tick_seconds.summary(),
+            'overruns': self.overruns,
+            'skipped': self.skipped,
+            'subscribers': [{'policy': s.policy, 'delivered': s.delivered, 'dropped': s.dropped}
+                            for s in self.subscribers]
+        }
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Harmonic Fusion Telemetry Server
+Localhost Server-Sent Events stream of FusionPhysicsSimulator telemetry
+
+One simulator runs at wall-clock pace on a background RealtimeDriver and
+publishes every tick into a shared TelemetryBroadcaster. Each viewer
+connects to /events and receives batched, columnar JSON frames at its own
+refresh rate; the server decimates the ticks since the viewer's last frame
+down to at most `points` samples, so a 100 Hz simulation costs a 10 Hz
+viewer ten small frames a second however many viewers are connected.
+
+Everything is standard library (http.server, threading, asyncio) and binds
+to 127.0.0.1, so it runs on an air-gapped machine. The built-in page at /
+draws the stream on a canvas without any external scripts; the bundled
+dashboards are served under /dashboards/ and scientific-telemetry-sim.html
+switches to the server's physics when opened with ?live.
+
+Endpoints:
+    GET  /                      built-in live dashboard
+    GET  /events?rate=10&points=20&fields=time,power_output
+                                SSE stream of telemetry frames
+    GET  /snapshot              latest frame as JSON
+    GET  /metrics               driver pacing metrics and viewer count
+    GET  /dashboards/<name>.html
+                                bundled HTML dashboards
+    POST /control               JSON {temp_keV, B_field, harmonic_amp}
+
+Usage: python fusion_server.py [--port 8765] [--host 127.0.0.1] [--rate 100]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from itertools import takewhile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from fusion_physics_simulation import (FusionPhysicsSimulator, configure_logging,
+                                       realtime_scenario, set_realtime_operating_point)
+from fusion_realtime import RealtimeDriver
+from fusion_telemetry import TELEMETRY_COLUMNS
+
+DASHBOARD_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Control inputs accepted by POST /control, as update_simulation keywords
+CONTROL_KEYS = ('temp_keV', 'B_field', 'harmonic_amp')
+
+# Smallest accepted value per control, and whether the bound itself is allowed;
+# zero temperature divides by zero in the reactivity, negative values give NaN
+CONTROL_MINIMUMS = {'temp_keV': (0.0, False), 'B_field': (0.0, False), 'harmonic_amp': (0.0, True)}
+
+class TelemetryBroadcaster:
+    """Thread-safe history of recent tick records, numbered by sequence
+
+    The simulation thread publishes; any number of viewer threads wait for
+    records newer than the last sequence they sent. Only the latest
+    `capacity` records are kept, so a viewer that falls further behind
+    simply skips ahead.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self._records: deque = deque(maxlen=capacity)
+        self._condition = threading.Condition()
+        self.sequence = 0
+        self.closed = False
+
+    def publish(self, record: Dict):
+        with self._condition:
+            self.sequence += 1
+            self._records.append((self.sequence, record))
+            self._condition.notify_all()
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def since(self, sequence: int, timeout: Optional[float] = None) -> Tuple[int, List[Dict]]:
+        """Records after `sequence` (waiting up to `timeout` for one) and the newest sequence
+
+        Walks back from the newest record only as far as `sequence`, so a frame
+        costs the records it sends, not the whole history.
+        """
+        with self._condition:
+            if self.sequence <= sequence and not self.closed:
+                self._condition.wait(timeout)
+            newer = [record for _, record in takewhile(lambda item: item[0] > sequence, reversed(self._records))]
+            newer.reverse()
+            return self.sequence, newer
+
+def decimate(records: Sequence[Dict], points: int) -> Sequence[Dict]:
+    """At most `points` evenly spaced records, always keeping the newest"""
+    if points <= 0 or len(records) <= points:
+        return records
+    indices = np.linspace(len(records) - 1, 0, points).round().astype(int)[::-1]
+    return [records[i] for i in indices]
+
+def _json_number(value) -> Optional[float]:
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+def encode_frame(sequence: int, records: Sequence[Dict], fields: Sequence[str]) -> str:
+    """Columnar JSON frame: {"seq": n, "count": k, "<field>": [k values], ...}
+
+    Non-finite values are sent as null, since NaN and Infinity are not JSON.
+    """
+    frame = {'seq': sequence, 'count': len(records)}
+    for field in fields:
+        frame[field] = [_json_number(record[field]) for record in records]
+    return json.dumps(frame, separators=(',', ':'), allow_nan=False)
+
+class TelemetryServer:
+    """Paced simulation plus the HTTP server that streams it"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, rate_hz: Optional[float] = None,
+                 simulator: Optional[FusionPhysicsSimulator] = None, history: int = 4096):
+        if simulator is None:
+            simulator = FusionPhysicsSimulator(telemetry_capacity=history)
+            simulator.enable_reactivity_table()
+            set_realtime_operating_point(simulator)
+        self.simulator = simulator
+        self.broadcaster = TelemetryBroadcaster(history)
+
+        self._scenario = realtime_scenario(simulator)
+        self._controls: Dict[str, float] = {}
+        self._controls_lock = threading.Lock()
+        self.driver = RealtimeDriver(simulator, rate_hz=rate_hz, schedule=self._schedule)
+
+        self.viewers = 0
+        self._viewers_lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.httpd.daemon_threads = True
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.httpd.server_address[:2]
+
+    def _schedule(self, step: int) -> Dict:
+        parameters = self._scenario(step)
+        with self._controls_lock:
+            parameters.update(self._controls)
+            self._controls.clear()
+        return parameters
+
+    def set_controls(self, controls: Dict[str, float]):
+        """Apply control inputs at the next tick
+
+        Unknown keys, non-finite values and values below CONTROL_MINIMUMS
+        (temperature and field must be positive, amplitude non-negative)
+        raise ValueError.
+        """
+        unknown = set(controls) - set(CONTROL_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown controls {sorted(unknown)}, expected {CONTROL_KEYS}")
+        values = {key: float(value) for key, value in controls.items()}
+        if not all(math.isfinite(value) for value in values.values()):
+            raise ValueError(f"Control values must be finite, got {values}")
+        for key, value in values.items():
+            minimum, inclusive = CONTROL_MINIMUMS[key]
+            if value < minimum or (value == minimum and not inclusive):
+                raise ValueError(f"{key} must be {'>=' if inclusive else '>'} {minimum}, got {value}")
+        with self._controls_lock:
+            self._controls.update(values)
+
+    async def _drive(self, duration_seconds: Optional[float]):
+        self._loop = asyncio.get_running_loop()
+        subscription = self.driver.subscribe(maxsize=1024, policy='drop_oldest')
+
+        async def forward():
+            async for record in subscription:
+                self.broadcaster.publish(record)
+
+        forwarder = asyncio.ensure_future(forward())
+        try:
+            await self.driver.run(duration_seconds=duration_seconds)
+            await forwarder
+        finally:
+            # Viewers get their end event even when a tick raised
+            forwarder.cancel()
+            self.broadcaster.close()
+
+    def start(self, duration_seconds: Optional[float] = None):
+        """Start the simulation and HTTP threads and return immediately"""
+        simulation = threading.Thread(target=asyncio.run, args=(self._drive(duration_seconds),),
+                                      name='fusion-simulation', daemon=True)
+        http = threading.Thread(target=self.httpd.serve_forever, name='fusion-http', daemon=True)
+        self._threads = [simulation, http]
+        for thread in self._threads:
+            thread.start()
+        host, port = self.address
+        logging.info(f"Telemetry server on http://{host}:{port}/ ({self.driver.rate_hz:.0f} Hz simulation)")
+
+    def stop(self):
+        """Stop the simulation, end every stream and close the listening socket"""
+        if self._threads:
+            simulation = self._threads[0]
+            if simulation.is_alive() and self._loop is not None:
+                self._loop.call_soon_threadsafe(self.driver.stop)
+            simulation.join(timeout=5)
+        self.broadcaster.close()
+        if self._threads:
+            self.httpd.shutdown()  # waits for serve_forever, so only after start()
+        self.httpd.server_close()
+
+    def stream(self, write, rate_hz: float, points: int, fields: Sequence[str]):
+        """Write SSE frames at `rate_hz` until the simulation ends or the viewer leaves"""
+        period = 1.0 / rate_hz
+        sequence = self.broadcaster.sequence
+        next_frame = time.monotonic()
+        with self._viewers_lock:
+            self.viewers += 1
+        try:
+            write(b'retry: 2000\n\n')
+            while True:
+                next_frame += period
+                delay = next_frame - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_frame = time.monotonic()  # viewer is slow; don't burst to catch up
+
+                sequence_now, records = self.broadcaster.since(sequence, timeout=period)
+                if records:
+                    frame = encode_frame(sequence_now, decimate(records, points), fields)
+                    write(f'data: {frame}\n\n'.encode())
+                    sequence = sequence_now
+                elif self.broadcaster.closed:
+                    write(b'event: end\ndata: {}\n\n')
+                    return
+                else:
+                    write(b': keep-alive\n\n')
+        finally:
+            with self._viewers_lock:
+                self.viewers -= 1
+
+def _make_handler(server: TelemetryServer):
+    class TelemetryRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            logging.debug(f"{self.address_string()} {format % args}")
+
+        def _send(self, status: int, body: bytes, content_type: str):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_json(self, value, status: int = 200):
+            self._send(status, json.dumps(value, default=float).encode(), 'application/json')
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+
+            if url.path == '/':
+                self._send(200, LIVE_PAGE.encode(), 'text/html; charset=utf-8')
+            elif url.path == '/events':
+                self._events(query)
+            elif url.path == '/snapshot':
+                sequence, records = server.broadcaster.since(server.broadcaster.sequence - 1, timeout=0)
+                fields = self._fields(query)
+                self._send(200, encode_frame(sequence, records[-1:], fields).encode(), 'application/json')
+            elif url.path == '/metrics':
+                self._send_json({'viewers': server.viewers, 'sequence': server.broadcaster.sequence,
+                                 **server.driver.metrics()})
+            elif url.path.startswith('/dashboards/'):
+                self._dashboard(url.path[len('/dashboards/'):])
+            else:
+                self._send(404, b'Not found', 'text/plain')
+
+        def do_POST(self):
+            if urlparse(self.path).path != '/control':
+                self._send(404, b'Not found', 'text/plain')
+                return
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                server.set_controls(json.loads(self.rfile.read(length) or b'{}'))
+            except (ValueError, TypeError) as e:
+                self._send_json({'error': str(e)}, status=400)
+                return
+            self._send_json({'accepted': True})
+
+        def _fields(self, query) -> List[str]:
+            if 'fields' not in query:
+                return list(TELEMETRY_COLUMNS)
+            return [f for f in query['fields'][0].split(',') if f in TELEMETRY_COLUMNS] or ['time']
+
+        def _events(self, query):
+            try:
+                rate = float(query.get('rate', ['10'])[0])
+                points = int(query.get('points', ['0'])[0])
+                if not math.isfinite(rate):
+                    raise ValueError(rate)
+            except ValueError:
+                self._send(400, b'rate and points must be finite numbers', 'text/plain')
+                return
+            rate = min(max(rate, 0.1), 120.0)
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            self.close_connection = True
+
+            def write(chunk: bytes):
+                self.wfile.write(chunk)
+                self.wfile.flush()
+
+            try:
+                server.stream(write, rate, points, self._fields(query))
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # viewer closed the page
+
+        def _dashboard(self, name: str):
+            # Only bundled top-level .html files; no path components allowed
+            if os.path.basename(name) != name or not name.endswith('.html'):
+                self._send(404, b'Not found', 'text/plain')
+                return
+            path = os.path.join(DASHBOARD_DIR, name)
+            if not os.path.isfile(path):
+                self._send(404, b'Not found', 'text/plain')
+                return
+            with open(path, 'rb') as f:
+                self._send(200, f.read(), 'text/html; charset=utf-8')
+
+    return TelemetryRequestHandler
+
+# Dependency-free live view: EventSource + canvas, so it works offline
+LIVE_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>Harmonic Fusion Live Telemetry</title>
+<style>
+  body { background: #0a0a0a; color: #00ffff; font-family: 'Courier New', monospace; margin: 20px; }
+  .metrics { display: flex; gap: 30px; flex-wrap: wrap; margin-bottom: 15px; }
+  .metric span { display: block; font-size: 1.6em; color: #ffff00; }
+  canvas { width: 100%; height: 260px; border: 1px solid #00ffff; margin-bottom: 12px; }
+  a { color: #00ffff; }
+</style>
+</head>
+<body>
+<h1>Harmonic Fusion Live Telemetry</h1>
+<div class="metrics">
+  <div class="metric">Time (s)<span id="time">-</span></div>
+  <div class="metric">Power (MW)<span id="power_output">-</span></div>
+  <div class="metric">Fusion rate (/m&sup3;/s)<span id="fusion_rate">-</span></div>
+  <div class="metric">Temperature (keV)<span id="plasma_temp">-</span></div>
+  <div class="metric">Beta<span id="plasma_beta">-</span></div>
+  <div class="metric">Coherence<span id="harmonic_coherence">-</span></div>
+</div>
+<canvas id="power" width="1200" height="260"></canvas>
+<canvas id="temp" width="1200" height="260"></canvas>
+<p>Dashboards: <a href="/dashboards/scientific-telemetry-sim.html?live">scientific telemetry (live)</a></p>
+<script>
+const HISTORY = 600;
+const series = { time: [], power_output: [], plasma_temp: [] };
+
+function draw(canvasId, key, color) {
+  const canvas = document.getElementById(canvasId), ctx = canvas.getContext('2d');
+  const values = series[key];
+  ctx.clearRect(0, 0, canvas.width, canvas.height);
+  if (values.length < 2) return;
+  const lo = Math.min(...values), hi = Math.max(...values), span = (hi - lo) || 1;
+  ctx.strokeStyle = color; ctx.lineWidth = 2; ctx.beginPath();
+  values.forEach((v, i) => {
+    const x = i / (HISTORY - 1) * canvas.width;
+    const y = canvas.height - 10 - (v - lo) / span * (canvas.height - 20);
+    i ? ctx.lineTo(x, y) : ctx.moveTo(x, y);
+  });
+  ctx.stroke();
+  ctx.fillStyle = color; ctx.fillText(key + '  [' + lo.toPrecision(4) + ', ' + hi.toPrecision(4) + ']', 8, 14);
+}
+
+const source = new EventSource('/events?rate=20&points=10');
+source.onmessage = (event) => {
+  const frame = JSON.parse(event.data);
+  for (const key of Object.keys(series)) {
+    series[key].push(...frame[key]);
+    series[key].splice(0, Math.max(0, series[key].length - HISTORY));
+  }
+  const last = frame.count - 1;
+  for (const id of ['time', 'power_output', 'fusion_rate', 'plasma_temp', 'plasma_beta', 'harmonic_coherence']) {
+    document.getElementById(id).textContent = Number(frame[id][last]).toPrecision(4);
+  }
+  draw('power', 'power_output', '#ffff00');
+  draw('temp', 'plasma_temp', '#ff00ff');
+};
+source.addEventListener('end', () => source.close());
+</script>
+</body>
+</html>
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream fusion telemetry to local dashboards')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--rate', type=float, default=None, help='simulation ticks per second (default 1/dt)')
+    parser.add_argument('--duration', type=float, default=None, help='stop after this many seconds')
+    args = parser.parse_args()
+
+    configure_logging()
+    server = TelemetryServer(args.host, args.port, rate_hz=args.rate)
+    server.start(args.duration)
+    try:
+        while server._threads[0].is_alive():
+            server._threads[0].join(timeout=0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+if __name__ == '__main__':
+    main()
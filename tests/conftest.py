@@ -0,0 +1,46 @@
+import logging
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fusion_core import ReactivityTable  # noqa: E402
+from fusion_physics_simulation import FusionPhysicsSimulator  # noqa: E402
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    logging.disable(logging.WARNING)
+    yield
+    logging.disable(logging.NOTSET)
+
+@pytest.fixture(scope='session')
+def reactivity_table() -> ReactivityTable:
+    """Synthetic <σv> table: nonzero power everywhere, and no quadrature to build it"""
+    temperatures = np.geomspace(0.5, 100, 64)
+    return ReactivityTable(temperatures, np.stack([temperatures**2 * 1e-24 * (1 + k) for k in range(4)], axis=1))
+
+@pytest.fixture
+def gamow_simulator(monkeypatch):
+    """Simulator on the bare Gamow cross-section A1 / (E exp(A1/√E)), nonzero at every energy"""
+    sim = FusionPhysicsSimulator(verbose=False)
+
+    def batch(energy_keV, harmonic=None):
+        psi, phi, coherence = sim._harmonic_arrays(harmonic)
+        energy_keV = np.asarray(energy_keV, dtype=float)
+        classical = 45.95 / (energy_keV * np.exp(45.95 / np.sqrt(energy_keV))) * 1e-27
+        energy_MeV = energy_keV / 1000
+        enhanced = classical * coherence * (
+            (1 + psi * np.exp(-((energy_MeV - sim.constants.PSI_0)**2) / (2 * 0.1**2))) *
+            (1 + phi * np.exp(-((energy_MeV - sim.constants.PHI)**2) / (2 * 0.2**2))))
+        return np.broadcast_to(classical, enhanced.shape), enhanced
+
+    def scalar(energy_keV, enhanced=False, harmonic=None):
+        classical, sigma = batch(energy_keV, harmonic or sim.harmonic_state)
+        return float(sigma if enhanced else classical)
+
+    monkeypatch.setattr(sim, 'calculate_dt_cross_section_batch', batch)
+    monkeypatch.setattr(sim, 'calculate_dt_cross_section', scalar)
+    return sim
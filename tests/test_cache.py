@@ -0,0 +1,52 @@
+import time
+
+from corrected_fusion_simulation import CorrectedFusionSimulator
+from fusion_cache import ResultCache
+from fusion_physics_simulation import FusionPhysicsSimulator
+
+def run_ticks(sim, ticks, **parameters):
+    for _ in range(ticks):
+        sim.update_simulation(**parameters)
+
+def test_report_cache_key_follows_ticks_and_harmonic_state(reactivity_table):
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False)
+    run_ticks(sim, 20, temp_keV=10.0)
+    key = sim.report_cache_key()
+    assert sim.report_cache_key() == key
+
+    sim.update_simulation()
+    ticked = sim.report_cache_key()
+    assert ticked != key
+
+    sim.harmonic_state.coherence_factor = 0.5
+    assert sim.report_cache_key() != ticked
+
+def test_report_cache_hit_between_ticks(reactivity_table):
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False)
+    run_ticks(sim, 20, temp_keV=10.0)
+    first = sim.generate_comprehensive_report()
+    assert sim.generate_comprehensive_report() == first
+    assert sim.cache.hits['memory'] == 1
+
+    sim.update_simulation(temp_keV=12.0)
+    assert sim.generate_comprehensive_report()['data_points'] == 21
+
+def test_shared_cache_keeps_simulators_apart(reactivity_table):
+    cache = ResultCache()
+    reports = []
+    for temperature in (5.0, 15.0):
+        sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False, cache=cache)
+        run_ticks(sim, 20, temp_keV=temperature)
+        reports.append(sim.generate_comprehensive_report())
+    assert cache.misses == 2
+    assert reports[0]['performance_metrics'] != reports[1]['performance_metrics']
+
+def test_corrected_report_timestamp_is_fresh_on_disk_hit(tmp_path):
+    first = CorrectedFusionSimulator(cache=ResultCache(str(tmp_path))).generate_corrected_validation_report()
+    time.sleep(0.01)
+    simulator = CorrectedFusionSimulator(cache=ResultCache(str(tmp_path)))
+    second = simulator.generate_corrected_validation_report()
+
+    assert simulator.cache.hits['disk'] == 1
+    assert second['validation_timestamp'] > first['validation_timestamp']
+    assert {**second, 'validation_timestamp': None} == {**first, 'validation_timestamp': None}
@@ -0,0 +1,10 @@
+import logging
+
+from fusion_core import configure_logging
+
+def test_configure_logging_keeps_existing_handlers(tmp_path, monkeypatch):
+    existing = logging.NullHandler()
+    monkeypatch.setattr(logging.getLogger(), 'handlers', [existing])
+    configure_logging(str(tmp_path / 'fusion_simulation.log'))
+    assert logging.getLogger().handlers == [existing]
+    assert list(tmp_path.iterdir()) == []
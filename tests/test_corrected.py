@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from corrected_fusion_simulation import CorrectedFusionSimulator, resonance_family
+
+ENERGIES = np.concatenate(([-1.0, 0.0], np.linspace(0.01, 10, 997)))
+
+@pytest.mark.parametrize('function, kwargs', [
+    ('harmonic_field_basic', {}),
+    ('harmonic_field_enhanced_corrected', {}),
+    ('traditional_fusion_probability', {}),
+    ('harmonic_fusion_basic', {'alpha': 5.0}),
+    ('harmonic_fusion_enhanced_corrected', {'alpha': 10.0}),
+])
+def test_vectorized_functions_match_scalar_calls(function, kwargs):
+    evaluate = getattr(CorrectedFusionSimulator(), function)
+    vectorized = evaluate(ENERGIES, **kwargs)
+    scalars = [evaluate(float(energy), **kwargs) for energy in ENERGIES]
+
+    assert vectorized.shape == ENERGIES.shape
+    assert all(np.ndim(value) == 0 for value in scalars)
+    # Arrays and scalars are squared through different NumPy paths: at most 1 ulp apart
+    np.testing.assert_allclose(vectorized, scalars, rtol=0, atol=2.3e-16)
+    assert np.all((vectorized >= 0) & (vectorized <= 1))
+
+def test_traditional_probability_cuts_off_at_zero_energy():
+    sim = CorrectedFusionSimulator()
+    np.testing.assert_array_equal(sim.traditional_fusion_probability(np.array([-1.0, 0.0])), [0.0, 0.0])
+    assert sim.traditional_fusion_probability(8.9875) == pytest.approx(np.exp(-1))
+
+def test_alpha_scan_matches_direct_evaluation():
+    sim = CorrectedFusionSimulator()
+    alphas = np.linspace(0.5, 20.0, 40)
+    scan = sim.scan_alpha(alphas, chunk_elements=1000)  # several chunks
+
+    traditional_avg = np.mean(sim.traditional_fusion_probability(sim.energies))
+    for i, alpha in enumerate(alphas):
+        basic = sim.harmonic_fusion_basic(sim.energies, alpha)
+        enhanced = sim.harmonic_fusion_enhanced_corrected(sim.energies, alpha)
+        assert scan['basic_average_probability'][i] == pytest.approx(np.mean(basic), rel=1e-12)
+        assert scan['enhanced_maximum_probability'][i] == pytest.approx(np.max(enhanced), rel=1e-12)
+        assert scan['enhanced_average_enhancement'][i] == pytest.approx(np.mean(enhanced) / traditional_avg,
+                                                                        rel=1e-12)
+
+def test_optimize_alpha_finds_interior_optimum_of_custom_objective():
+    sim = CorrectedFusionSimulator()
+
+    def probability_minus_cost(row):
+        return row['enhanced_average_probability'] - 0.01 * row['alpha']
+
+    result = sim.optimize_alpha((0.1, 50.0), objective=probability_minus_cost, xatol=1e-6)
+    assert result['objective'] == 'probability_minus_cost' and result['converged']
+    assert not result['at_bound']
+
+    alphas = np.linspace(0.1, 50.0, 20001)
+    dense = sim.scan_alpha(alphas)['enhanced_average_probability'] - 0.01 * alphas
+    assert result['optimal_alpha'] == pytest.approx(alphas[np.argmax(dense)], abs=2 * (alphas[1] - alphas[0]))
+    assert result['objective_value'] >= dense.max() - 1e-12
+
+    # The built-in objectives increase with alpha, so they peak at the upper bound
+    assert sim.optimize_alpha((1.0, 10.0))['optimal_alpha'] == 10.0
+
+def baseline_window_peaks(sim, energies, windows):
+    """The per-energy loop detect_resonance_peaks_corrected used before the indexed lookup"""
+    results = {f'{window.name}_resonances': [] for window in windows}
+    for energy in energies:
+        for window in windows:
+            if abs(energy - window.center_MeV) < window.half_width_MeV:
+                enhancement = (sim.harmonic_fusion_enhanced_corrected(energy) /
+                               sim.traditional_fusion_probability(energy))
+                results[f'{window.name}_resonances'].append({'energy_MeV': energy,
+                                                             'enhancement_factor': enhancement})
+    results['total_peaks'] = sum(len(hits) for hits in results.values())
+    return results
+
+@pytest.mark.parametrize('grid', ['default', 'window_edges', 'unsorted'])
+def test_window_lookup_matches_baseline_loop(grid):
+    sim = CorrectedFusionSimulator()
+    windows = sim.default_resonance_windows() + resonance_family(sim.constants.PSI_0, sim.constants.PHI,
+                                                                 range(-2, 4), 'psi_phi', 0.08)
+    energies = sim.energies
+    if grid == 'window_edges':
+        # Points exactly on (and one ulp around) every window edge, where the strict test decides
+        edges = np.concatenate([[w.center_MeV - w.half_width_MeV, w.center_MeV + w.half_width_MeV] for w in windows])
+        energies = np.sort(np.concatenate((energies, edges, np.nextafter(edges, 0), np.nextafter(edges, 20))))
+    elif grid == 'unsorted':
+        energies = np.random.default_rng(2).permutation(energies)
+
+    indexed = sim.detect_resonance_peaks_corrected(energies, windows)
+    baseline = baseline_window_peaks(sim, np.sort(energies), windows)
+    assert indexed['total_peaks'] == baseline['total_peaks'] > 0
+    for window in windows:
+        key = f'{window.name}_resonances'
+        assert [hit['energy_MeV'] for hit in indexed[key]] == [hit['energy_MeV'] for hit in baseline[key]]
+        np.testing.assert_allclose([hit['enhancement_factor'] for hit in indexed[key]],
+                                   [hit['enhancement_factor'] for hit in baseline[key]], rtol=1e-14)
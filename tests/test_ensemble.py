@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from fusion_physics_simulation import EnsembleFusionSimulator, FusionPhysicsSimulator
+from fusion_telemetry import load_telemetry
+
+def make_ensemble(table):
+    return EnsembleFusionSimulator([5.0, 10.0, 15.0], [8.0, 10.0, 12.0], [0.2, 0.5, 0.2],
+                                   reactivity_table=table, verbose=False)
+
+def test_ensemble_report_and_save(reactivity_table, tmp_path):
+    sim = make_ensemble(reactivity_table)
+    for _ in range(20):
+        sim.update_simulation()
+
+    report = sim.generate_comprehensive_report()
+    assert report['ensemble_members'] == 3
+    assert report['data_points'] == 20
+    resonance = report['resonance_analysis']
+    assert all(len(values) == 3 for values in resonance.values())
+
+    # Members 0 and 2 share a harmonic amplitude, so they share their peaks
+    assert sim.resonance_peaks[0] is sim.resonance_peaks[2]
+    for member in (0, 1):
+        single = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False)
+        single.update_simulation(harmonic_amp=[0.2, 0.5][member])
+        assert resonance['peak_count'][member] == len(single.resonance_peaks)
+
+    filename = sim.save_telemetry(str(tmp_path / 'ensemble.npz'))
+    columns, saved_report = load_telemetry(filename)
+    assert columns['power_output'].shape == (20, 3)
+    assert saved_report['resonance_analysis'] == resonance
+
+def test_ensemble_records_high_enhancement(reactivity_table, monkeypatch):
+    sim = make_ensemble(reactivity_table)
+    monkeypatch.setattr(sim, 'calculate_dt_cross_section_batch',
+                        lambda energy_keV, harmonic=None: (np.ones(3), np.array([1.0, 50.0, 1.0])))
+    for _ in range(5):
+        sim.update_simulation()
+
+    totals = sim.events.summary()['by_type']['high_enhancement']
+    assert totals['open_episode_ticks'] == 5
+    assert totals['peak'] == 50.0
+
+def test_ensemble_parquet_round_trip(reactivity_table, tmp_path):
+    pytest.importorskip('pyarrow')
+    sim = make_ensemble(reactivity_table)
+    for _ in range(10):
+        sim.update_simulation()
+
+    filename = sim.save_telemetry(str(tmp_path / 'ensemble.parquet'))
+    columns, report = load_telemetry(filename)
+    assert report['ensemble_members'] == 3
+    for key, values in sim.telemetry.items():
+        np.testing.assert_array_equal(columns[key], values)
+
+    subset, _ = load_telemetry(filename, columns=['time', 'power_output'])
+    assert list(subset) == ['time', 'power_output']
+    np.testing.assert_array_equal(subset['power_output'], sim.telemetry['power_output'])
@@ -0,0 +1,38 @@
+import logging
+
+from fusion_events import EVENT_LOGGER, EventLog, stop_event_listener
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+def test_consecutive_ticks_coalesce_into_one_episode(monkeypatch):
+    monkeypatch.setattr(logging.getLogger(), 'handlers', [])
+    handler = ListHandler()
+    logging.getLogger().addHandler(handler)
+    logging.disable(logging.NOTSET)
+    monkeypatch.setattr(logging.getLogger(), 'level', logging.INFO)
+
+    events = EventLog(rate_per_second=0.0, burst=2)
+    for tick in range(100):
+        if 10 <= tick < 50:
+            events.record('high_beta', tick * 0.01, 0.1 + tick * 1e-3)
+        if tick % 2:
+            events.record('high_enhancement', tick * 0.01, 11.0)
+        events.end_tick()
+    events.flush()
+    stop_event_listener()
+
+    beta = events.summary()['by_type']['high_beta']
+    assert beta['episodes'] == 1 and beta['ticks'] == 40 and beta['peak'] == 0.1 + 49e-3
+    assert 'High beta for 40 consecutive ticks (0.10-0.49s, peak beta 0.149)' in handler.messages
+
+    # 50 one-tick enhancement episodes: two tokens, the rest suppressed and reported at the flush
+    enhancement = events.summary()['by_type']['high_enhancement']
+    assert enhancement['episodes'] == 50 and enhancement['logged'] == 2 and enhancement['suppressed'] == 48
+    assert '48 high_enhancement records suppressed by rate limiting' in handler.messages
+    assert logging.getLogger(EVENT_LOGGER).propagate is False
@@ -0,0 +1,32 @@
+import numpy as np
+
+from fusion_physics_simulation import FusionPhysicsSimulator, realtime_scenario, set_realtime_operating_point
+from fusion_telemetry import TELEMETRY_COLUMNS, read_telemetry_stream
+
+def run_ticks(table, ticks, **options):
+    sim = FusionPhysicsSimulator(reactivity_table=table, verbose=False, **options)
+    set_realtime_operating_point(sim)
+    parameters = realtime_scenario(sim)
+    for step in range(ticks):
+        sim.update_simulation(**parameters(step))
+    return sim
+
+def test_low_allocation_matches_default(reactivity_table):
+    default = run_ticks(reactivity_table, 200)
+    low = run_ticks(reactivity_table, 200, low_allocation=True)
+    for key in TELEMETRY_COLUMNS:
+        np.testing.assert_array_equal(low.telemetry[key], default.telemetry[key])
+
+def test_low_allocation_stream_keeps_every_tick(reactivity_table, tmp_path):
+    stream = str(tmp_path / 'stream.jsonl')
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False, low_allocation=True)
+    set_realtime_operating_point(sim)
+    sim.attach_telemetry_stream(stream, flush_interval=0.05)
+    parameters = realtime_scenario(sim)
+    for step in range(500):
+        sim.update_simulation(**parameters(step))
+    sim.detach_telemetry_stream()
+
+    streamed = read_telemetry_stream(stream)
+    for key in TELEMETRY_COLUMNS:
+        np.testing.assert_array_equal(streamed[key], sim.telemetry.raw(key))
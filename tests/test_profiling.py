@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from fusion_physics_simulation import FusionPhysicsSimulator
+from fusion_profiling import NULL_PROFILER, LogHistogram
+
+STAGES = {'plasma_parameters', 'fusion_rate', 'cross_section', 'telemetry'}
+
+def test_profiler_counts_work_per_tick(reactivity_table):
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False)
+    profiler = sim.enable_profiling()
+    for step in range(20):
+        sim.update_simulation(3.0 if step < 10 else 15.0, 10.0, 0.5)
+
+    summary = profiler.summary()
+    assert summary['ticks'] == 20
+    assert set(summary['stage_share']) == STAGES
+    assert sum(summary['stage_share'].values()) == pytest.approx(1.0)
+    assert summary['stage_seconds']['tick']['count'] == 20
+
+    counters = summary['counters_per_tick']
+    assert counters['table_lookups']['count'] == 20 and counters['table_lookups']['mean'] == 1
+    assert counters['cross_section_calls']['mean'] == 1  # one batch call for classical and enhanced
+    assert 'quad_calls' not in counters
+
+    by_temperature = {tuple(row['temperature_range_keV']): row['ticks'] for row in summary['by_temperature']}
+    assert by_temperature == {(2.0, 5.0): 10, (10.0, 20.0): 10}
+    assert sim.generate_comprehensive_report()['profiling']['ticks'] == 20
+
+def test_quadrature_fallback_is_counted():
+    sim = FusionPhysicsSimulator(verbose=False)
+    profiler = sim.enable_profiling()
+    sim.update_simulation(10.0, 10.0, 0.5)
+
+    counters = profiler.summary()['counters_per_tick']
+    assert counters['quad_calls']['total'] == 1
+    # quad's integrand evaluations are scalar cross-section calls, plus the tick's own batch call
+    assert counters['cross_section_calls']['total'] == counters['quad_evaluations']['total'] + 1
+
+    assert sim.disable_profiling() is profiler and sim.profiler is NULL_PROFILER
+    sim.update_simulation(10.0, 10.0, 0.5)
+    assert profiler.ticks == 1
+
+def test_log_histogram_quantiles_stay_within_a_bin():
+    histogram = LogHistogram(1e-3, 1e3)
+    values = np.geomspace(1e-2, 1e2, 1001)
+    for value in values:
+        histogram.add(value)
+
+    bin_ratio = 10 ** (1 / 10)
+    for q in (0.5, 0.9, 0.99):
+        assert histogram.quantile(q) == pytest.approx(np.quantile(values, q), rel=bin_ratio - 1)
+    assert histogram.summary()['total'] == pytest.approx(values.sum())
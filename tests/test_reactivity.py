@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from fusion_core import HarmonicState
+from fusion_physics_simulation import FusionPhysicsSimulator
+
+ENERGIES = np.concatenate(([-1.0, 0.0], np.geomspace(1e-6, 1e4, 50)))
+
+def harmonic(psi, phi, coherence=0.9):
+    return HarmonicState(psi_amplitude=psi, phi_amplitude=phi, base_amplitude=0.0,
+                         coherence_factor=coherence, resonance_match=0.0)
+
+# The scalar path overflows exp(A1/√θ) at the smallest energies (to σ = 0)
+@pytest.mark.filterwarnings('ignore:overflow encountered in exp')
+def test_batch_cross_section_matches_scalar():
+    sim = FusionPhysicsSimulator(verbose=False)
+    states = [harmonic(0.0, 0.0), harmonic(0.5, 0.4), harmonic(1.0, 0.8, coherence=0.3)]
+
+    classical, enhanced = sim.calculate_dt_cross_section_batch(ENERGIES, states)
+    assert classical.shape == enhanced.shape == (len(states), len(ENERGIES))
+    for row, state in enumerate(states):
+        for column, energy in enumerate(ENERGIES):
+            assert classical[row, column] == sim.calculate_dt_cross_section(energy, harmonic=state)
+            assert enhanced[row, column] == sim.calculate_dt_cross_section(energy, enhanced=True, harmonic=state)
+
+    # Array-valued fields broadcast element-wise against the energies
+    psi = np.linspace(0.0, 1.0, len(ENERGIES))
+    _, elementwise = sim.calculate_dt_cross_section_batch(ENERGIES, harmonic(psi, 0.8 * psi))
+    expected = [sim.calculate_dt_cross_section(energy, enhanced=True, harmonic=harmonic(p, 0.8 * p))
+                for energy, p in zip(ENERGIES, psi)]
+    np.testing.assert_array_equal(elementwise, expected)
+
+    # Without a harmonic argument both use the simulator's current state
+    _, current = sim.calculate_dt_cross_section_batch(ENERGIES)
+    np.testing.assert_array_equal(current, [sim.calculate_dt_cross_section(e, enhanced=True) for e in ENERGIES])
+
+def test_table_matches_quadrature_within_its_error_bound(gamow_simulator):
+    sim = gamow_simulator
+    table = sim.enable_reactivity_table(temp_min_keV=1.0, temp_max_keV=50.0, points=128)
+    assert 0 < table.error_bound < 1e-3
+
+    rng = np.random.default_rng(0)
+    for temp_keV, psi, coherence in zip(rng.uniform(1.0, 50.0, 20), rng.uniform(0.0, 1.0, 20),
+                                        rng.uniform(0.1, 1.0, 20)):
+        state = harmonic(psi, 0.8 * psi, coherence)
+        exact = sim._reactivity_quad(temp_keV, state)
+        assert exact > 0
+        assert sim.calculate_reactivity(temp_keV, state) == pytest.approx(exact, rel=2 * table.error_bound + 1e-8)
+
+    # Outside the table the exact quadrature answers
+    state = harmonic(0.5, 0.4)
+    assert sim.calculate_reactivity(80.0, state) == sim._reactivity_quad(80.0, state)
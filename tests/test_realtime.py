@@ -0,0 +1,18 @@
+from fusion_physics_simulation import FusionPhysicsSimulator, run_realtime_simulation
+from fusion_telemetry import load_telemetry
+
+def test_realtime_metrics_reach_saved_report(reactivity_table, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def use_test_table(self, **table_options):
+        self.reactivity_table = reactivity_table
+        return reactivity_table
+    monkeypatch.setattr(FusionPhysicsSimulator, 'enable_reactivity_table', use_test_table)
+
+    sim, report, filename = run_realtime_simulation(duration_seconds=0.2, telemetry_format='npz', realtime=True)
+    assert len(sim.telemetry) == 20
+    assert report['realtime']['ticks'] == 20
+
+    _, saved_report = load_telemetry(filename)
+    assert saved_report['realtime'] == report['realtime']
+    assert saved_report['performance_metrics'] == report['performance_metrics']
@@ -0,0 +1,67 @@
+import numpy as np
+
+def count_detections(sim, monkeypatch):
+    """Patch detect_resonance_peaks to record its calls; returns (calls, unpatched detect)"""
+    calls = []
+    detect = sim.detect_resonance_peaks
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return detect(*args, **kwargs)
+    monkeypatch.setattr(sim, 'detect_resonance_peaks', counting)
+    return calls, detect
+
+def test_resonance_peaks_recomputed_only_when_harmonic_state_changes(gamow_simulator, monkeypatch):
+    sim = gamow_simulator
+    calls, detect = count_detections(sim, monkeypatch)
+
+    for _ in range(10):
+        sim.update_simulation(10.0, 10.0, 0.5)
+        peaks = sim.resonance_peaks
+    assert len(calls) == 1
+    assert peaks and peaks == detect()
+
+    sim.update_simulation(10.0, 10.0, 0.8)
+    changed = sim.resonance_peaks
+    assert len(calls) == 2
+    assert changed == detect()
+    assert [p['cross_section'] for p in changed] != [p['cross_section'] for p in peaks]
+
+    sim.invalidate_resonance_peaks()
+    sim.resonance_peaks
+    assert len(calls) == 3
+
+def test_per_tick_resonance_peaks_are_opt_in(gamow_simulator, monkeypatch):
+    sim = gamow_simulator
+    calls, detect = count_detections(sim, monkeypatch)
+    assert 'resonance_peaks' not in sim.update_simulation(10.0, 10.0, 0.5)
+    assert calls == []
+
+    sim.resonance_per_tick = True
+    record = sim.update_simulation(10.0, 10.0, 0.5)
+    assert len(calls) == 1
+    assert record['resonance_peaks'] == detect()
+
+def test_refined_peaks_converge_to_the_true_maximum(gamow_simulator):
+    sim = gamow_simulator
+    energies = np.linspace(0.1, 10, 100)
+    coarse = sim.detect_resonance_peaks(energies)
+    assert coarse
+
+    spacing = energies[1] - energies[0]
+    for peak in coarse:
+        # Reference maximum from a grid 10⁵ times finer than the coarse one
+        fine = np.linspace(peak['energy_MeV'] - spacing, peak['energy_MeV'] + spacing, 200001)
+        true_energy = fine[np.argmax(sim.calculate_dt_cross_section_batch(fine * 1000)[1])]
+
+        errors = []
+        for tolerance in (1e-2, 1e-4, 1e-6):
+            refined = [p for p in sim.detect_resonance_peaks(energies, tolerance_MeV=tolerance)
+                       if abs(p['energy_MeV'] - peak['energy_MeV']) < spacing]
+            assert len(refined) == 1
+            refined = refined[0]
+            errors.append(abs(refined['energy_MeV'] - true_energy))
+            assert errors[-1] <= tolerance + (fine[1] - fine[0])
+            assert refined['cross_section'] >= peak['cross_section']
+            assert refined['evaluations'] < len(energies) + 50
+        assert errors[-1] <= errors[0]
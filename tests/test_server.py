@@ -0,0 +1,79 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from fusion_physics_simulation import FusionPhysicsSimulator, set_realtime_operating_point
+from fusion_server import TelemetryBroadcaster, TelemetryServer, encode_frame
+
+@pytest.fixture
+def server(reactivity_table):
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False, telemetry_capacity=256)
+    set_realtime_operating_point(sim)
+    server = TelemetryServer(port=0, simulator=sim, history=256)
+    server.start(duration_seconds=2.0)
+    yield 'http://%s:%d' % server.address
+    server.stop()
+
+def status(request) -> int:
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+@pytest.mark.parametrize('rate', ['nan', 'inf', '-inf', 'fast'])
+def test_events_reject_invalid_rate(server, rate):
+    assert status(f'{server}/events?rate={rate}') == 400
+
+def test_control_rejects_non_finite_values(server):
+    def post(body: bytes):
+        return urllib.request.Request(f'{server}/control', data=body, method='POST',
+                                      headers={'Content-Type': 'application/json'})
+
+    assert status(post(b'{"temp_keV": NaN}')) == 400
+    assert status(post(b'{"B_field": Infinity}')) == 400
+    assert status(post(json.dumps({'temp_keV': 12.0}).encode())) == 200
+
+@pytest.mark.parametrize('controls', [{'temp_keV': 0}, {'temp_keV': -1.0}, {'B_field': 0.0}, {'harmonic_amp': -0.1}])
+def test_control_rejects_out_of_range_values(server, controls):
+    request = urllib.request.Request(f'{server}/control', data=json.dumps(controls).encode(), method='POST')
+    assert status(request) == 400
+
+def test_frames_encode_non_finite_values_as_null():
+    frame = json.loads(encode_frame(7, [{'time': 0.0, 'power_output': float('nan')},
+                                        {'time': 0.01, 'power_output': float('inf')}], ['time', 'power_output']))
+    assert frame == {'seq': 7, 'count': 2, 'time': [0.0, 0.01], 'power_output': [None, None]}
+
+def test_failed_tick_ends_every_stream(reactivity_table, monkeypatch):
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False)
+    server = TelemetryServer(port=0, simulator=sim)
+    calls = []
+
+    def failing_update(**parameters):
+        calls.append(parameters)
+        raise RuntimeError("tick failed")
+    monkeypatch.setattr(sim, 'update_simulation', failing_update)
+    monkeypatch.setattr(threading, 'excepthook', lambda args: None)
+
+    server.start()
+    server._threads[0].join(timeout=5)
+    try:
+        assert calls and server.broadcaster.closed
+    finally:
+        server.stop()
+
+def test_since_returns_only_newer_records():
+    broadcaster = TelemetryBroadcaster(capacity=8)
+    for value in range(12):
+        broadcaster.publish({'time': float(value)})
+    assert broadcaster.since(10, timeout=0) == (12, [{'time': 10.0}, {'time': 11.0}])
+    assert [r['time'] for r in broadcaster.since(0, timeout=0)[1]] == [float(v) for v in range(4, 12)]
+    assert broadcaster.since(12, timeout=0) == (12, [])
+
+def test_stop_before_start(reactivity_table):
+    server = TelemetryServer(port=0, simulator=FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False))
+    server.stop()
+    assert server.broadcaster.closed
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from fusion_core import HarmonicState, PlasmaState, ReactivityTable, TorusGeometry
+from fusion_physics_simulation import FusionPhysicsSimulator
+
+@pytest.fixture
+def table_builds(reactivity_table, monkeypatch):
+    """Record enable_reactivity_table calls, attaching a synthetic table over the requested range"""
+    builds = []
+
+    def build(self, temp_min_keV=0.5, temp_max_keV=100.0):
+        builds.append((temp_min_keV, temp_max_keV))
+        temperatures = np.geomspace(temp_min_keV, temp_max_keV, 64)
+        self.reactivity_table = ReactivityTable(temperatures, np.stack(
+            [temperatures**2 * 1e-24 * (1 + k) for k in range(4)], axis=1))
+        return self.reactivity_table
+    monkeypatch.setattr(FusionPhysicsSimulator, 'enable_reactivity_table', build)
+    return builds
+
+def test_cold_edge_never_falls_back_to_quadrature(table_builds, monkeypatch):
+    sim = FusionPhysicsSimulator(verbose=False)
+    sim.enable_spatial_model(TorusGeometry(radial_cells=20, poloidal_cells=20))
+    assert table_builds == [(pytest.approx(0.1), 100.0)]
+
+    def no_quad(self, temp_keV, harmonic):
+        raise AssertionError(f"quadrature fallback at {temp_keV} keV")
+    monkeypatch.setattr(FusionPhysicsSimulator, '_reactivity_quad', no_quad)
+    sim.update_simulation(temp_keV=1.0, B_field=10.0, harmonic_amp=0.5)
+    assert sim.telemetry['power_output'][-1] > 0
+
+def test_short_table_is_extended_and_covering_table_kept(table_builds, reactivity_table):
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False)
+    sim.enable_spatial_model(TorusGeometry(radial_cells=4, poloidal_cells=4), min_core_temp_keV=2.0)
+    assert table_builds == [(pytest.approx(0.2), reactivity_table.temp_max_keV)]
+
+    covering = sim.reactivity_table
+    sim.enable_spatial_model(TorusGeometry(radial_cells=4, poloidal_cells=4), min_core_temp_keV=5.0)
+    assert sim.reactivity_table is covering and len(table_builds) == 1
+
+def test_flat_profile_matches_uniform_model(reactivity_table):
+    plasma = PlasmaState(15.0, 1e20, 10.0, 0.0, 0.0, 1.0)
+    harmonic = HarmonicState(0.3, 0.2, 0.0, 0.8, 0.0)
+    uniform_rate, uniform_power = FusionPhysicsSimulator(
+        reactivity_table=reactivity_table, verbose=False).calculate_fusion_rate(plasma, harmonic)
+
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False)
+    geometry = sim.enable_spatial_model(TorusGeometry(radial_cells=8, poloidal_cells=8, edge_temperature_fraction=1.0,
+                                                      edge_density_fraction=1.0), min_core_temp_keV=5.0)
+    rate, power = sim.calculate_fusion_rate(plasma, harmonic)
+    assert rate == pytest.approx(uniform_rate, rel=1e-12)
+    assert power == pytest.approx(uniform_power * geometry.volume_m3 / 100, rel=1e-9)
@@ -0,0 +1,118 @@
+import json
+import logging
+
+import numpy as np
+import pytest
+
+import fusion_physics_simulation
+from fusion_core import ReactivityTable
+from fusion_physics_simulation import (FusionPhysicsSimulator, run_parameter_optimization,
+                                       run_parameter_sweep, simulate_sweep_point)
+
+@pytest.fixture
+def no_table_builds(monkeypatch):
+    def build(self, **table_options):
+        raise AssertionError("reactivity table rebuilt despite a prebuilt one")
+    monkeypatch.setattr(FusionPhysicsSimulator, 'enable_reactivity_table', build)
+
+def test_sweep_reuses_prebuilt_table(reactivity_table, no_table_builds):
+    df = run_parameter_sweep([5.0, 10.0], [8.0], [0.5], steps=5, workers=1, save=False,
+                             reactivity_table=reactivity_table)
+    assert list(df['temperature_keV']) == [5.0, 10.0]
+    assert (df['power_output_MW'] > 0).all()
+
+def test_optimization_reuses_prebuilt_table(reactivity_table, no_table_builds):
+    result = run_parameter_optimization([(5.0, 10.0), (8.0, 12.0), (0.2, 0.8)], objective='power', steps=2,
+                                        max_evaluations=30, reactivity_table=reactivity_table)
+    assert result['evaluations'] <= 30
+
+def test_optimization_recovers_known_optimum(reactivity_table):
+    optimum = (12.3, 9.1, 0.42)
+    bounds = [(1.0, 20.0), (5.0, 15.0), (0.1, 1.0)]
+
+    def peak(row):
+        point = (row['temperature_keV'], row['magnetic_field_T'], row['harmonic_amplitude'])
+        return -sum(((x - best) / (high - low))**2 for x, best, (low, high) in zip(point, optimum, bounds))
+
+    result = run_parameter_optimization(bounds, objective=peak, steps=1, max_evaluations=150,
+                                        reactivity_table=reactivity_table)
+    assert result['objective'] == 'peak'
+    assert result['converged']
+    found = result['optimal_parameters']
+    assert found['temperature_keV'] == pytest.approx(optimum[0], abs=0.05)
+    assert found['magnetic_field_T'] == pytest.approx(optimum[1], abs=0.05)
+    assert found['harmonic_amplitude'] == pytest.approx(optimum[2], abs=0.005)
+
+def test_parent_process_table_is_not_left_installed(reactivity_table):
+    run_parameter_optimization([(5.0, 10.0), (8.0, 12.0), (0.2, 0.8)], steps=1, max_evaluations=10,
+                               reactivity_table=reactivity_table)
+    run_parameter_sweep([5.0], [8.0], [0.5], steps=1, workers=1, save=False, reactivity_table=reactivity_table)
+    assert fusion_physics_simulation._sweep_reactivity_table is None
+
+def test_checkpoint_resumes_and_extends(reactivity_table, tmp_path):
+    checkpoint = str(tmp_path / 'sweep.jsonl')
+    options = dict(steps=5, workers=1, save=False, checkpoint=checkpoint, reactivity_table=reactivity_table)
+    run_parameter_sweep([5.0, 10.0], [8.0], [0.5], **options)
+
+    # A point cut off mid-write is dropped and recomputed
+    with open(checkpoint, 'a') as f:
+        f.write('{"temperature_keV": 15.0, "magnetic')
+    df = run_parameter_sweep([5.0, 10.0, 15.0], [8.0], [0.5], **options)
+
+    with open(checkpoint) as f:
+        lines = [json.loads(line) for line in f]
+    assert lines[0]['steps'] == 5
+    assert [row['temperature_keV'] for row in lines[1:]] == [5.0, 10.0, 15.0]
+
+    expected = simulate_sweep_point((15.0, 8.0, 0.5), steps=5, reactivity_table=reactivity_table)
+    assert df['power_output_MW'].iloc[2] == pytest.approx(expected['power_output_MW'])
+    assert np.all(np.diff(df['temperature_keV']) > 0)
+
+    with pytest.raises(ValueError):
+        run_parameter_sweep([5.0], [8.0], [0.5], **dict(options, steps=6))
+
+def test_checkpoint_rejects_other_table_or_replaced_grid(reactivity_table, tmp_path):
+    checkpoint = str(tmp_path / 'sweep.jsonl')
+    options = dict(steps=2, workers=1, save=False, checkpoint=checkpoint)
+    run_parameter_sweep([5.0, 10.0], [8.0], [0.5], reactivity_table=reactivity_table, **options)
+
+    other_table = ReactivityTable(reactivity_table.temperatures, 2 * reactivity_table.basis_rates)
+    with pytest.raises(ValueError, match='reactivity table'):
+        run_parameter_sweep([5.0, 10.0], [8.0], [0.5], reactivity_table=other_table, **options)
+    with pytest.raises(ValueError, match='grid'):
+        run_parameter_sweep([5.0, 12.0], [8.0], [0.5], reactivity_table=reactivity_table, **options)
+
+def test_checkpoint_keeps_rows_finished_before_a_failure(reactivity_table, tmp_path, monkeypatch):
+    checkpoint = str(tmp_path / 'sweep.jsonl')
+    options = dict(steps=2, workers=1, save=False, checkpoint=checkpoint, reactivity_table=reactivity_table)
+    run_point = fusion_physics_simulation.simulate_sweep_point
+
+    def fail_at_15_keV(point, *args, **kwargs):
+        if point[0] == 15.0:
+            raise RuntimeError("worker died")
+        return run_point(point, *args, **kwargs)
+    monkeypatch.setattr(fusion_physics_simulation, 'simulate_sweep_point', fail_at_15_keV)
+    with pytest.raises(RuntimeError):
+        run_parameter_sweep([5.0, 10.0, 15.0], [8.0], [0.5], **options)
+
+    with open(checkpoint) as f:
+        assert [json.loads(line).get('temperature_keV') for line in f][1:] == [5.0, 10.0]
+
+def test_process_pool_sweep_checkpoints_in_grid_order(reactivity_table, tmp_path):
+    checkpoint = str(tmp_path / 'sweep.jsonl')
+    temperatures = [2.0, 4.0, 6.0, 8.0, 10.0]
+    df = run_parameter_sweep(temperatures, [8.0], [0.5], steps=2, workers=2, chunksize=2, save=False,
+                             checkpoint=checkpoint, reactivity_table=reactivity_table)
+    assert list(df['temperature_keV']) == temperatures
+
+    with open(checkpoint) as f:
+        rows = [json.loads(line) for line in f][1:]
+    assert sorted(row['temperature_keV'] for row in rows) == temperatures
+    by_temperature = {row['temperature_keV']: row['power_output_MW'] for row in rows}
+    assert list(df['power_output_MW']) == pytest.approx([by_temperature[t] for t in temperatures])
+
+def test_sweep_opens_no_log_file(reactivity_table, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(logging.getLogger(), 'handlers', [])
+    run_parameter_sweep([5.0], [8.0], [0.5], steps=2, workers=1, save=False, reactivity_table=reactivity_table)
+    assert list(tmp_path.iterdir()) == []
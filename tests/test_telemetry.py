@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from fusion_physics_simulation import FusionPhysicsSimulator
+from fusion_telemetry import (REPORT_COLUMNS, TelemetryStatistics, TelemetryStore, TelemetryStreamWriter,
+                              batch_summary, load_telemetry, read_telemetry_stream, write_telemetry)
+
+def records(count):
+    return [{key: float(i) * (j + 1) for j, key in enumerate(REPORT_COLUMNS)} for i in range(count)]
+
+def test_ring_buffer_keeps_latest_records_in_order():
+    store = TelemetryStore(REPORT_COLUMNS, capacity=4, ring=True)
+    for record in records(10):
+        store.append(record)
+    assert len(store) == 4 and store.total_appended == 10 and store.wrapped
+    np.testing.assert_array_equal(store[REPORT_COLUMNS[0]], [6, 7, 8, 9])
+
+def test_windowed_statistics_match_batch_summary():
+    store = TelemetryStore(REPORT_COLUMNS, capacity=16, ring=True)
+    statistics = TelemetryStatistics(REPORT_COLUMNS, window=16)
+    for record in records(50):
+        store.append(record)
+        statistics.update(record)
+
+    streamed, batch = statistics.summary(), batch_summary(store)
+    for key in REPORT_COLUMNS:
+        for stat in ('count', 'mean', 'std', 'min', 'max'):
+            assert streamed[key][stat] == pytest.approx(batch[key][stat])
+
+def test_running_statistics_match_batch_summary():
+    rng = np.random.default_rng(1)
+    store = TelemetryStore(REPORT_COLUMNS)
+    statistics = TelemetryStatistics(REPORT_COLUMNS)
+    for _ in range(1000):
+        record = {key: float(rng.normal(1e3, 50.0)) for key in REPORT_COLUMNS}
+        store.append(record)
+        statistics.update(record)
+
+    streamed, batch = statistics.summary(), batch_summary(store)
+    for key in REPORT_COLUMNS:
+        assert streamed[key]['count'] == batch[key]['count'] == 1000
+        for stat in ('mean', 'std', 'min', 'max'):
+            assert streamed[key][stat] == pytest.approx(batch[key][stat], rel=1e-9)
+
+def test_report_from_streaming_statistics_matches_batch(reactivity_table):
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False)
+    for step in range(100):
+        sim.update_simulation(5.0 + 0.1 * step, 10.0, 0.3 + 0.005 * step)
+    streamed = sim.generate_comprehensive_report()
+
+    sim.statistics = None  # what the report falls back to: a batch pass over the columns
+    batch = sim._compute_comprehensive_report()
+    for section in ('performance_metrics', 'stability_metrics'):
+        assert streamed[section] == pytest.approx(batch[section], rel=1e-9)
+
+@pytest.mark.parametrize('format', ['json', 'npz', 'parquet'])
+def test_write_and_load_round_trip(tmp_path, format):
+    if format == 'parquet':
+        pytest.importorskip('pyarrow')
+    store = TelemetryStore(REPORT_COLUMNS)
+    for record in records(5):
+        store.append(record)
+    filename = str(tmp_path / f'telemetry.{format}')
+    write_telemetry(filename, dict(store.items()), {'data_points': 5})
+
+    columns, report = load_telemetry(filename)
+    assert report == {'data_points': 5}
+    for key in REPORT_COLUMNS:
+        np.testing.assert_array_equal(columns[key], store[key])
+
+def test_stream_resumes_after_truncated_tail(tmp_path):
+    filename = str(tmp_path / 'stream.jsonl')
+    with TelemetryStreamWriter(filename, flush_interval=0.01, fsync=False) as writer:
+        for record in records(5):
+            writer.submit(record)
+    assert writer.written == 5
+
+    with open(filename, 'a') as f:
+        f.write('{"time": 99.0, "fusion_ra')  # killed mid-write
+    with TelemetryStreamWriter(filename, flush_interval=0.01, fsync=False) as writer:
+        for record in records(8)[5:]:
+            writer.submit(record)
+
+    streamed = read_telemetry_stream(filename, columns=REPORT_COLUMNS)
+    expected = records(8)
+    for key in REPORT_COLUMNS:
+        np.testing.assert_array_equal(streamed[key], [record[key] for record in expected])
+
+def test_stream_counts_every_record_written_or_dropped(tmp_path):
+    filename = str(tmp_path / 'stream.jsonl')
+    with TelemetryStreamWriter(filename, flush_interval=10.0, max_queue=4, fsync=False) as writer:
+        accepted = sum(writer.submit(record) for record in records(100))
+    assert writer.written == accepted and writer.dropped == 100 - accepted
+    assert len(read_telemetry_stream(filename, columns=REPORT_COLUMNS)[REPORT_COLUMNS[0]]) == accepted
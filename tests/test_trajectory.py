@@ -0,0 +1,30 @@
+import numpy as np
+
+from fusion_physics_simulation import (FusionPhysicsSimulator, realtime_scenario, realtime_trajectory,
+                                       set_realtime_operating_point)
+from fusion_telemetry import TELEMETRY_COLUMNS
+
+def test_realtime_trajectory_matches_step_loop(reactivity_table):
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False)
+    set_realtime_operating_point(sim)
+    trajectory = realtime_trajectory(sim, 3.0)
+    assert len(sim.telemetry) == 0
+
+    parameters = realtime_scenario(sim)
+    for step in range(len(trajectory['time'])):
+        sim.update_simulation(**parameters(step))
+
+    assert set(trajectory) == set(TELEMETRY_COLUMNS)
+    for key in TELEMETRY_COLUMNS:
+        np.testing.assert_allclose(trajectory[key], sim.telemetry[key], rtol=1e-9, atol=1e-12)
+
+def test_trajectory_schedules(reactivity_table):
+    sim = FusionPhysicsSimulator(reactivity_table=reactivity_table, verbose=False)
+    times = np.linspace(0, 1, 5)
+    trajectory = sim.simulate_trajectory(times, temp_keV=lambda t: 10 + t, harmonic_amp=[0.1, 0.2, 0.3, 0.4, 0.5])
+
+    np.testing.assert_allclose(trajectory['plasma_temp'], 10 + times)
+    np.testing.assert_allclose(trajectory['magnetic_field'], sim.plasma_state.magnetic_field_T)
+    np.testing.assert_allclose(trajectory['harmonic_coherence'],
+                               np.array([0.1, 0.2, 0.3, 0.4, 0.5]) * 2.4 / 3 * sim.harmonic_state.coherence_factor)
+    assert sim.time == 0.0